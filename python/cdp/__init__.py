@@ -4,7 +4,7 @@ from cdp.end_user_client import ListEndUsersResult
 from cdp.evm_call_types import ContractCall, EncodedCall, FunctionCall
 from cdp.evm_local_account import EvmLocalAccount
 from cdp.evm_server_account import EvmServerAccount
-from cdp.evm_smart_account import EvmSmartAccount
+from cdp.evm_smart_account import EvmSmartAccount, use_api_clients
 from cdp.evm_transaction_types import TransactionRequestEIP1559
 from cdp.openapi_client import SpendPermissionNetwork
 from cdp.openapi_client.errors import HttpErrorType, NetworkError
@@ -37,4 +37,5 @@ __all__ = [
     "UpdateAccountOptions",
     "__version__",
     "parse_units",
+    "use_api_clients",
 ]
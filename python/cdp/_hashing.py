@@ -0,0 +1,33 @@
+"""Keccak-256 helper with an optional hardware-accelerated backend.
+
+Typed-data signing and checksumming hash many small buffers, so the cost of
+the Keccak kernel itself shows up on those paths. When the `pysha3` C
+extension is installed its `keccak_256` is used directly; otherwise this
+falls back to `eth_utils.keccak` (backed by `eth_hash.auto`), so behavior is
+identical either way.
+"""
+
+from eth_utils import keccak as _eth_utils_keccak
+
+try:  # pragma: no cover - depends on optional pysha3 install
+    from sha3 import keccak_256 as _keccak_256
+except ImportError:
+    _keccak_256 = None
+
+
+def keccak256(data: bytes) -> bytes:
+    """Compute the Keccak-256 digest of `data`.
+
+    Callers hashing several fragments should concatenate them and make a
+    single call rather than hashing each piece separately.
+
+    Args:
+        data (bytes): The bytes to hash.
+
+    Returns:
+        bytes: The 32-byte Keccak-256 digest.
+
+    """
+    if _keccak_256 is not None:
+        return _keccak_256(data).digest()
+    return _eth_utils_keccak(data)
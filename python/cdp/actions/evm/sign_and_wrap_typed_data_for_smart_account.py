@@ -7,9 +7,26 @@ handling the specific requirements of the smart contract implementation.
 from typing import Any
 
 from eth_abi import encode
+from eth_account._utils.encode_typed_data import hash_domain
+from eth_account._utils.encode_typed_data.encoding_and_hashing import hash_struct
 from web3 import Web3
 
+from cdp._hashing import keccak256
 from cdp.api_clients import ApiClients
+from cdp.openapi_client.models.eip712_domain import EIP712Domain
+from cdp.openapi_client.models.eip712_message import EIP712Message
+
+# Static EIP-712 scaffolding for the replay-safe wrapper; shared across calls
+# and treated as read-only by the encoder.
+_REPLAY_SAFE_TYPES = {
+    "EIP712Domain": [
+        {"name": "name", "type": "string"},
+        {"name": "version", "type": "string"},
+        {"name": "chainId", "type": "uint256"},
+        {"name": "verifyingContract", "type": "address"},
+    ],
+    "CoinbaseSmartWalletMessage": [{"name": "hash", "type": "bytes32"}],
+}
 
 
 class SignAndWrapTypedDataForSmartAccountOptions:
@@ -155,9 +172,6 @@ async def sign_and_wrap_typed_data_for_smart_account(
     owner = options.smart_account.owners[options.owner_index]
 
     # Convert typed data to the format expected by the API
-    from cdp.openapi_client.models.eip712_domain import EIP712Domain
-    from cdp.openapi_client.models.eip712_message import EIP712Message
-
     eip712_message = EIP712Message(
         domain=EIP712Domain(
             name=replay_safe_typed_data["domain"].get("name"),
@@ -209,19 +223,14 @@ def create_replay_safe_typed_data(
         Dict[str, Any]: The EIP-712 typed data structure for the replay-safe hash
 
     """
-    # Use eth_account's internal utilities to correctly hash EIP-712 data
-    from eth_account._utils.encode_typed_data import hash_domain
-    from eth_account._utils.encode_typed_data.encoding_and_hashing import hash_struct
-    from eth_utils import keccak
-
-    # Hash the EIP-712 data
+    # Hash the EIP-712 data with eth_account's internal utilities
     domain_hash = hash_domain(typed_data["domain"])
     message_hash = hash_struct(
         typed_data["primaryType"], typed_data["types"], typed_data["message"]
     )
 
     # Construct the final hash: keccak256("\x19\x01" || domainSeparator || messageHash)
-    original_hash = keccak(b"\x19\x01" + domain_hash + message_hash).hex()
+    original_hash = keccak256(b"\x19\x01" + domain_hash + message_hash).hex()
 
     # Ensure the hash has 0x prefix
     if not original_hash.startswith("0x"):
@@ -235,15 +244,7 @@ def create_replay_safe_typed_data(
             "chainId": chain_id,
             "verifyingContract": Web3.to_checksum_address(smart_account_address),
         },
-        "types": {
-            "EIP712Domain": [
-                {"name": "name", "type": "string"},
-                {"name": "version", "type": "string"},
-                {"name": "chainId", "type": "uint256"},
-                {"name": "verifyingContract", "type": "address"},
-            ],
-            "CoinbaseSmartWalletMessage": [{"name": "hash", "type": "bytes32"}],
-        },
+        "types": _REPLAY_SAFE_TYPES,
         "primaryType": "CoinbaseSmartWalletMessage",
         "message": {
             "hash": original_hash,
@@ -1,7 +1,18 @@
+import asyncio
+import random
 import time
 
 from cdp.api_clients import ApiClients
 
+# Statuses after which a user operation can never change again
+_TERMINAL_STATUSES = ("complete", "failed")
+
+# Ceiling for the exponential backoff between polls
+_MAX_POLL_INTERVAL_SECONDS = 2.0
+
+# Fraction of the delay added as random jitter to avoid synchronized polling
+_POLL_JITTER_FRACTION = 0.1
+
 
 async def wait_for_user_operation(
     api_clients: ApiClients,
@@ -12,12 +23,20 @@ async def wait_for_user_operation(
 ):
     """Wait for a user operation to be processed.
 
+    Polls with exponential backoff: the first check happens after
+    `interval_seconds`, and each subsequent delay doubles (plus a little
+    jitter) up to a 2-second ceiling, so short-lived operations are caught
+    quickly without hammering the API for slow ones. Polling is the only
+    transport the API offers for this — its push channel is webhook
+    subscriptions, which require a caller-hosted endpoint and are out of
+    scope for an in-process wait.
+
     Args:
         api_clients: The API clients object.
         smart_account_address (str): The address of the smart account that sent the operation.
         user_op_hash (str): The hash of the user operation to wait for.
         timeout_seconds (float, optional): Maximum time to wait in seconds. Defaults to 20.
-        interval_seconds (float, optional): Time between checks in seconds. Defaults to 0.2.
+        interval_seconds (float, optional): Initial time between checks in seconds. Defaults to 0.2.
 
     Returns:
         EvmUserOperation: The final user operation object.
@@ -28,22 +47,23 @@ async def wait_for_user_operation(
     """
     start_time = time.time()
 
-    # Get initial state - this matches what we see in the diff
     user_operation = await api_clients.evm_smart_accounts.get_user_operation(
         smart_account_address,
         user_op_hash,
     )
 
-    # Use a regular while loop that explicitly checks the status
-    while user_operation.status not in ["complete", "failed"]:
+    attempt = 0
+    while user_operation.status not in _TERMINAL_STATUSES:
         # Check timeout before making next API call
         if time.time() - start_time > timeout_seconds:
             raise TimeoutError("User Operation timed out")
 
-        # Wait before checking again
-        time.sleep(interval_seconds)
+        delay = min(interval_seconds * (2**attempt), _MAX_POLL_INTERVAL_SECONDS)
+        if attempt > 0:
+            delay += random.uniform(0, delay * _POLL_JITTER_FRACTION)
+        await asyncio.sleep(delay)
+        attempt += 1
 
-        # Make API call to check status
         user_operation = await api_clients.evm_smart_accounts.get_user_operation(
             smart_account_address,
             user_op_hash,
@@ -1,16 +1,22 @@
 import asyncio
+import atexit
 import contextlib
 import functools
-import hashlib
-import inspect
 import json
 import os
+import threading
 import time
-import traceback
-import weakref
+from collections import deque
+from concurrent.futures import Future
+from contextvars import ContextVar
+from dataclasses import dataclass
 from typing import Any, Literal
+from urllib.parse import urlparse
 
-from pydantic import BaseModel
+try:  # orjson is optional; fall back to stdlib json when it is not installed
+    import orjson as _orjson
+except ImportError:  # pragma: no cover
+    _orjson = None
 
 from cdp.__version__ import __version__
 from cdp.errors import UserInputValidationError
@@ -22,8 +28,85 @@ public_client_id = "54f2ee2fb3d2b901a829940d70fbfc13"
 # Attribute name to store the original method on wrapped functions
 _ORIGINAL_METHOD = "_cdp_original_method"
 
+# Attribute name marking methods that never call themselves via the class,
+# so they can be wrapped without recursion protection
+_NO_RECURSION = "_cdp_no_recursion"
 
-class ErrorEventData(BaseModel):
+
+def no_recursion_needed(func):
+    """Mark a method as safe to wrap without recursion protection.
+
+    Methods that never invoke themselves via ClassName.method_name can skip
+    the in-flight bookkeeping entirely, leaving only the error-tracking
+    try/except around the call.
+
+    Args:
+        func: The method to mark.
+
+    Returns:
+        The same method, marked.
+
+    """
+    setattr(func, _NO_RECURSION, True)
+    return func
+
+
+# Disable flags cached at import so hot paths skip repeated os.getenv lookups.
+# Call _refresh_flags() after changing the env vars (used by tests).
+_USAGE_TRACKING_DISABLED = os.getenv("DISABLE_CDP_USAGE_TRACKING") == "true"
+_ERROR_REPORTING_DISABLED = os.getenv("DISABLE_CDP_ERROR_REPORTING") == "true"
+
+
+def _refresh_flags() -> None:
+    """Re-read the tracking disable flags from the environment."""
+    global _USAGE_TRACKING_DISABLED, _ERROR_REPORTING_DISABLED
+    _USAGE_TRACKING_DISABLED = os.getenv("DISABLE_CDP_USAGE_TRACKING") == "true"
+    _ERROR_REPORTING_DISABLED = os.getenv("DISABLE_CDP_ERROR_REPORTING") == "true"
+
+
+# How long the background flush task waits before sending a partial batch
+FLUSH_INTERVAL_SECONDS = 60.0
+# Maximum number of events sent in a single POST
+MAX_BATCH_SIZE = 50
+# Maximum number of pending events; new events are dropped when the queue is full
+# (drop-newest keeps SDK calls latency-free instead of applying backpressure)
+MAX_QUEUE_SIZE = 10_000
+
+# The analytics collector currently validates an MD5 checksum on the payload.
+# Flip this off once it accepts BLAKE2b-128, which hashes the batched JSON
+# noticeably faster per byte; the tag is transport integrity only, not security.
+_LEGACY_CHECKSUM = True
+
+# Lazily initialized batching state. Events are buffered by send_event and
+# drained by a single flush task on the analytics daemon loop, so SDK calls
+# never pay for an HTTP round-trip. A deque (appends are atomic under the GIL)
+# rather than an asyncio.Queue, which would bind to one event loop while
+# send_event may run on any caller's loop.
+_event_buffer: deque | None = None
+_flush_task: Future | None = None
+# Wakeup signal for the flush loop; created and only ever touched on the
+# analytics daemon loop (other threads reach it via call_soon_threadsafe)
+_flush_wakeup: asyncio.Event | None = None
+# Events dropped on queue overflow since the last flush; reported in a
+# synthetic analytics_dropped event once the queue drains
+_dropped_events = 0
+_session = None  # aiohttp.ClientSession, created lazily
+_session_loop: asyncio.AbstractEventLoop | None = None
+
+# Optional callable returning the SDK's own aiohttp session (registered by
+# CdpClient) so analytics shares its connection pool and DNS cache instead of
+# maintaining a second HTTP stack.
+_session_provider = None
+
+# Dedicated event loop for analytics work submitted from sync contexts. It runs
+# on a daemon thread so it never blocks the SDK user's loop or interpreter exit.
+_background_loop: asyncio.AbstractEventLoop | None = None
+_background_thread: threading.Thread | None = None
+_background_lock = threading.Lock()
+
+
+@dataclass(slots=True)
+class ErrorEventData:
     """The data in an error event."""
 
     method: str  # The API method where the error occurred, e.g. createAccount, getAccount
@@ -31,14 +114,33 @@ class ErrorEventData(BaseModel):
     name: Literal["error"]  # The name of the event. This should match the name in AEC
     stack: str | None = None  # The error stack trace
 
+    def to_dict(self) -> dict[str, Any]:
+        """Return the event fields as a plain dict."""
+        return {
+            "method": self.method,
+            "message": self.message,
+            "name": self.name,
+            "stack": self.stack,
+        }
+
 
-class ActionEventData(BaseModel):
+@dataclass(slots=True)
+class ActionEventData:
     """The data in an action event."""
 
     action: str  # The operation being performed, e.g. "transfer", "swap", "fund", "requestFaucet"
+    name: Literal["action"]  # The name of the event
     account_type: Literal["evm_server", "evm_smart", "solana"] | None = None  # The account type
     properties: dict[str, Any] | None = None  # Additional properties specific to the action
-    name: Literal["action"]  # The name of the event
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the event fields as a plain dict."""
+        return {
+            "action": self.action,
+            "account_type": self.account_type,
+            "properties": self.properties,
+            "name": self.name,
+        }
 
 
 EventData = ErrorEventData | ActionEventData
@@ -47,6 +149,18 @@ Analytics = {
     "identifier": "",  # set in cdp_client.py
 }
 
+# Event properties that never change for the lifetime of the process; built
+# once and merged into every event instead of re-created per send_event call
+_STATIC_EVENT_PROPS = {
+    "project_name": "cdp-sdk",
+    "cdp_sdk_language": "python",
+    "version": __version__,
+}
+
+# (class id, method name) keys currently executing in this context; used by the
+# error-tracking wrappers to short-circuit recursive self-calls via the class.
+_in_flight: ContextVar[frozenset] = ContextVar("cdp_in_flight", default=frozenset())
+
 
 def track_action(
     action: str,
@@ -61,7 +175,7 @@ def track_action(
         properties: Additional properties
 
     """
-    if os.getenv("DISABLE_CDP_USAGE_TRACKING") == "true":
+    if _USAGE_TRACKING_DISABLED:
         return
 
     # Handle custom RPC host similar to TypeScript
@@ -71,10 +185,16 @@ def track_action(
         and isinstance(properties["network"], str)
         and properties["network"].startswith("http")
     ):
-        from urllib.parse import urlparse
-
-        url = urlparse(properties["network"])
-        properties["customRpcHost"] = url.hostname
+        network = properties["network"]
+        # Fast path: slice the host out directly; fall back to full URL parsing
+        # for anything unusual (userinfo, IPv6 literals, missing authority)
+        authority = network.split("://", 1)[-1]
+        for sep in ("/", "?", "#"):
+            authority = authority.split(sep, 1)[0]
+        host = authority.split(":", 1)[0]
+        if not host or "@" in host or host.startswith("["):
+            host = urlparse(network).hostname
+        properties["customRpcHost"] = host
         properties["network"] = "custom"
 
     event_data = ActionEventData(
@@ -90,22 +210,26 @@ def track_action(
 
 
 async def send_event(event: EventData) -> None:
-    """Send an analytics event to the default endpoint.
+    """Queue an analytics event for delivery to the default endpoint.
+
+    Events are batched and flushed by a background task every
+    FLUSH_INTERVAL_SECONDS (or sooner when MAX_BATCH_SIZE events accumulate),
+    so this call never performs an HTTP round-trip itself.
 
     Args:
         event: The event data containing event-specific fields
 
     Returns:
-        None - resolves when the event is sent
+        None - resolves when the event is queued
 
     """
-    if event.name == "error" and os.getenv("DISABLE_CDP_ERROR_REPORTING") == "true":
+    if event.name == "error" and _ERROR_REPORTING_DISABLED:
         return
 
-    if event.name != "error" and os.getenv("DISABLE_CDP_USAGE_TRACKING") == "true":
+    if event.name != "error" and _USAGE_TRACKING_DISABLED:
         return
 
-    timestamp = int(time.time() * 1000)
+    timestamp = time.time_ns() // 1_000_000
 
     enhanced_event = {
         "user_id": Analytics["identifier"],
@@ -113,48 +237,294 @@ async def send_event(event: EventData) -> None:
         "platform": "server",
         "timestamp": timestamp,
         "event_properties": {
-            "project_name": "cdp-sdk",
-            "cdp_sdk_language": "python",
-            "version": __version__,
-            **event.model_dump(),
+            **_STATIC_EVENT_PROPS,
+            **event.to_dict(),
         },
     }
 
-    events = [enhanced_event]
-    stringified_event_data = json.dumps(events)
-    upload_time = str(timestamp)
+    _enqueue_event(enhanced_event)
+
+
+def _enqueue_event(enhanced_event: dict[str, Any]) -> None:
+    """Add an event to the pending queue, dropping it if the queue is full.
+
+    Args:
+        enhanced_event: The fully built event payload to queue.
+
+    """
+    global _event_buffer, _dropped_events
+
+    if _event_buffer is None:
+        with _background_lock:
+            if _event_buffer is None:
+                _event_buffer = deque()
+                atexit.register(_shutdown)
+
+    # Preserve fire-and-forget semantics: never block, drop on overflow
+    if len(_event_buffer) >= MAX_QUEUE_SIZE:
+        _dropped_events += 1
+    else:
+        _event_buffer.append(enhanced_event)
+
+    _ensure_flush_task()
+
+
+def _ensure_flush_task() -> None:
+    """Run the flush loop on the analytics loop, starting it on first use.
+
+    The buffer has exactly one consumer: a single flush task pinned to the
+    analytics daemon loop. Caller loops never run flush tasks of their own.
+    """
+    global _flush_task
+
+    loop = _get_background_loop()
+    if _flush_task is None or _flush_task.done():
+        with _background_lock:
+            if _flush_task is None or _flush_task.done():
+                _flush_task = asyncio.run_coroutine_threadsafe(_flush_loop(), loop)
+                return
+
+    # Wake the flusher through the owner loop's self-pipe so events buffered
+    # from other threads are delivered promptly, not on the next interval
+    loop.call_soon_threadsafe(_wake_flusher)
+
+
+def _wake_flusher() -> None:
+    """Signal the flush loop that events are waiting; runs on the analytics loop."""
+    if _flush_wakeup is not None:
+        _flush_wakeup.set()
+
+
+async def _flush_loop() -> None:
+    """Drain the event buffer forever, POSTing batches as they accumulate."""
+    global _flush_wakeup
+
+    _flush_wakeup = asyncio.Event()
+    while True:
+        if not _event_buffer:
+            with contextlib.suppress(TimeoutError, asyncio.TimeoutError):
+                await asyncio.wait_for(_flush_wakeup.wait(), timeout=FLUSH_INTERVAL_SECONDS)
+        _flush_wakeup.clear()
+
+        batch = []
+        while _event_buffer and len(batch) < MAX_BATCH_SIZE:
+            batch.append(_event_buffer.popleft())
+
+        dropped_event = _take_dropped_event()
+        if dropped_event is not None:
+            batch.append(dropped_event)
+
+        if batch:
+            # One bad batch must not kill the flusher
+            with contextlib.suppress(Exception):
+                await _post_events(batch)
+
+
+async def _flush_pending() -> None:
+    """Immediately POST any buffered events as a single batch."""
+    if _event_buffer is None:
+        return
+
+    events = []
+    while _event_buffer and len(events) < MAX_BATCH_SIZE:
+        events.append(_event_buffer.popleft())
+
+    dropped_event = _take_dropped_event()
+    if dropped_event is not None:
+        events.append(dropped_event)
+
+    if events:
+        await _post_events(events)
+
+
+def set_session_provider(provider) -> None:
+    """Register a callable returning the SDK's shared aiohttp session.
+
+    Args:
+        provider: A zero-argument callable returning an aiohttp.ClientSession,
+            or None to revert analytics to its own session.
+
+    """
+    global _session_provider
+    _session_provider = provider
+
+
+def _take_dropped_event() -> dict[str, Any] | None:
+    """Build a synthetic event reporting overflow drops, if any occurred.
+
+    Returns:
+        The analytics_dropped event payload, or None when nothing was dropped.
+
+    """
+    global _dropped_events
+
+    if not _dropped_events:
+        return None
+
+    count, _dropped_events = _dropped_events, 0
+    return {
+        "user_id": Analytics["identifier"],
+        "event_type": "analytics_dropped",
+        "platform": "server",
+        "timestamp": time.time_ns() // 1_000_000,
+        "event_properties": {
+            **_STATIC_EVENT_PROPS,
+            "name": "analytics_dropped",
+            "dropped": count,
+        },
+    }
+
+
+def _get_session():
+    """Return the aiohttp session for analytics uploads.
+
+    Prefers the SDK's own session (one connection pool and DNS cache for the
+    whole process); falls back to a private session created for the running
+    loop when no usable shared session is available.
+    """
+    global _session, _session_loop
+
+    import aiohttp
+
+    loop = asyncio.get_running_loop()
+
+    if _session_provider is not None:
+        with contextlib.suppress(Exception):
+            shared = _session_provider()
+            if shared is not None and not shared.closed and shared._loop is loop:
+                return shared
+
+    if _session is None or _session.closed or _session_loop is not loop:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=4, ttl_dns_cache=300),
+            timeout=aiohttp.ClientTimeout(total=1.0),  # 1 second timeout
+        )
+        _session_loop = loop
+
+    return _session
+
+
+def _checksum(payload_bytes: bytes, upload_time: str) -> str:
+    """Compute the payload integrity tag for a batch upload.
+
+    Args:
+        payload_bytes: The serialized events array.
+        upload_time: The upload timestamp in milliseconds, as a string.
+
+    Returns:
+        The hex digest the collector verifies.
+
+    """
+    import hashlib
+
+    if _LEGACY_CHECKSUM:
+        return hashlib.md5(
+            payload_bytes + upload_time.encode("ascii"), usedforsecurity=False
+        ).hexdigest()
+
+    digest = hashlib.blake2b(payload_bytes, digest_size=16)
+    digest.update(upload_time.encode("ascii"))
+    return digest.hexdigest()
 
-    checksum = hashlib.md5((stringified_event_data + upload_time).encode("utf-8")).hexdigest()
+
+async def _post_events(events: list[dict[str, Any]]) -> None:
+    """POST a batch of events to the analytics endpoint.
+
+    Args:
+        events: The batch of event payloads to send.
+
+    """
+    try:
+        if _orjson is not None:
+            payload_bytes = _orjson.dumps(events)
+        else:
+            payload_bytes = json.dumps(events).encode("utf-8")
+    except TypeError:
+        # orjson rejects some values stdlib json accepts (e.g. ints over
+        # 64 bits); retry with stdlib before giving up on the batch
+        try:
+            payload_bytes = json.dumps(events).encode("utf-8")
+        except Exception:
+            return
+    upload_time = str(time.time_ns() // 1_000_000)
 
     analytics_service_data = {
         "client": public_client_id,
-        "e": stringified_event_data,
-        "checksum": checksum,
+        "e": payload_bytes.decode("utf-8"),
+        "checksum": _checksum(payload_bytes, upload_time),
     }
 
+    if _orjson is not None:
+        body = _orjson.dumps(analytics_service_data)
+    else:
+        body = json.dumps(analytics_service_data).encode("utf-8")
+
     api_endpoint = "https://cca-lite.coinbase.com"
     event_path = "/amp"
     event_endpoint = f"{api_endpoint}{event_path}"
 
-    # Use aiohttp for truly async behavior
     try:
         import aiohttp
 
-        async with aiohttp.ClientSession() as session:  # noqa: SIM117
-            async with session.post(
-                event_endpoint,
-                headers={"Content-Type": "application/json"},
-                json=analytics_service_data,
-                timeout=aiohttp.ClientTimeout(total=1.0),  # 1 second timeout
-            ) as response:
-                await response.text()  # Read response to complete the request
+        session = _get_session()
+        async with session.post(
+            event_endpoint,
+            headers={"Content-Type": "application/json"},
+            data=body,
+            timeout=aiohttp.ClientTimeout(total=1.0),  # 1 second timeout
+        ) as response:
+            await response.text()  # Read response to complete the request
     except Exception:
         # Silently ignore any request errors
         pass
 
 
+def _shutdown() -> None:
+    """Flush any queued events and close the shared session at interpreter exit."""
+    with contextlib.suppress(Exception):
+        if _background_loop is not None and _background_loop.is_running():
+            # Flush on the analytics loop, which owns the session and queue
+            future = asyncio.run_coroutine_threadsafe(_flush_and_close(), _background_loop)
+            future.result(timeout=2.0)
+        else:
+            asyncio.run(_flush_and_close())
+
+
+async def _flush_and_close() -> None:
+    """Send remaining events and close the shared session."""
+    global _session
+
+    await _flush_pending()
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """Return the analytics event loop, starting its daemon thread on first use."""
+    global _background_loop, _background_thread
+
+    if _background_loop is None:
+        with _background_lock:
+            if _background_loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever,
+                    name="cdp-analytics",
+                    daemon=True,
+                )
+                thread.start()
+                _background_thread = thread
+                _background_loop = loop
+
+    return _background_loop
+
+
 def _run_async_in_sync(coro_func, *args, **kwargs):
-    """Run an async coroutine in a sync context.
+    """Schedule an async coroutine from a sync context without waiting for it.
+
+    The coroutine is submitted to the dedicated analytics event loop, so this
+    never touches (or creates) an event loop on the caller's thread.
 
     Args:
         coro_func: The coroutine function to run
@@ -162,36 +532,13 @@ def _run_async_in_sync(coro_func, *args, **kwargs):
         **kwargs: Keyword arguments for the coroutine function
 
     Returns:
-        Any: The result of the coroutine, or None if it fails
+        None - the coroutine runs in the background
 
     """
-    try:
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-
-        # Check if loop is already running (e.g., in Jupyter notebooks)
-        if loop.is_running():
-            # Use run_coroutine_threadsafe to properly schedule in running loop
-            # This ensures the coroutine is scheduled immediately
-            future = asyncio.run_coroutine_threadsafe(coro_func(*args, **kwargs), loop)
-            # For error events, wait briefly to ensure they're sent
-            if len(args) > 0 and hasattr(args[0], "name") and args[0].name == "error":
-                try:  # noqa: SIM105
-                    # Wait up to 100ms for the error event to be sent
-                    future.result(timeout=0.1)
-                except Exception:
-                    pass  # Ignore any errors, we tried our best
-            return None
-
-        # Create and run the coroutine only if we can actually run it
-        coroutine = coro_func(*args, **kwargs)
-        return loop.run_until_complete(coroutine)
-    except Exception:
-        # If anything goes wrong, silently fail to avoid breaking the SDK
-        return None
+    # If anything goes wrong, silently fail to avoid breaking the SDK
+    with contextlib.suppress(Exception):
+        asyncio.run_coroutine_threadsafe(coro_func(*args, **kwargs), _get_background_loop())
+    return None
 
 
 def _get_original_method(method):
@@ -207,127 +554,55 @@ def _get_original_method(method):
     return getattr(method, _ORIGINAL_METHOD, method)
 
 
-def _create_recursive_interceptor(executing_instances, original_method_ref):
-    """Create an interceptor function that prevents recursive calls.
-
-    Args:
-        executing_instances: A WeakSet tracking instances currently executing.
-        original_method_ref: Reference to the original unwrapped method.
-
-    Returns:
-        A function that intercepts calls and prevents recursion.
-
-    """
-
-    async def async_interceptor(self, *args, **kwargs):
-        # Try to check if already executing - if object can't be hashed yet, it's not in the set
-        try:
-            is_executing = self in executing_instances
-        except (AttributeError, TypeError):
-            is_executing = False
-
-        if is_executing:
-            # Return first arg if recursive call detected
-            return args[0] if args else None
-
-        # Call original method directly, not the wrapper
-        try:
-            executing_instances.add(self)
-        except (AttributeError, TypeError):
-            # If we can't add to the set, just execute without recursion protection
-            return await original_method_ref(self, *args, **kwargs)
-
-        try:
-            return await original_method_ref(self, *args, **kwargs)
-        finally:
-            executing_instances.discard(self)
-
-    def sync_interceptor(self, *args, **kwargs):
-        # Try to check if already executing - if object can't be hashed yet, it's not in the set
-        try:
-            is_executing = self in executing_instances
-        except (AttributeError, TypeError):
-            is_executing = False
-
-        if is_executing:
-            # Return first arg if recursive call detected
-            return args[0] if args else None
-
-        # Call original method directly, not the wrapper
-        try:
-            executing_instances.add(self)
-        except (AttributeError, TypeError):
-            # If we can't add to the set, just execute without recursion protection
-            return original_method_ref(self, *args, **kwargs)
-
-        try:
-            return original_method_ref(self, *args, **kwargs)
-        finally:
-            executing_instances.discard(self)
-
-    return (
-        async_interceptor if inspect.iscoroutinefunction(original_method_ref) else sync_interceptor
-    )
-
-
-def _create_error_tracking_wrapper(original_method, method_name, executing_instances, cls_or_obj):
+def _create_error_tracking_wrapper(original_method, method_name, cls_or_obj):
     """Create a wrapper function with error tracking and recursion protection.
 
+    Recursion is detected with a ContextVar holding the set of in-flight
+    (class, method) keys, so the wrapper never mutates class attributes.
+
     Args:
         original_method: The original method to wrap.
         method_name: The name of the method being wrapped.
-        executing_instances: A WeakSet tracking instances currently executing.
-        cls_or_obj: The class or object to get/set the method on.
+        cls_or_obj: The class or object the method is defined on.
 
     Returns:
         A wrapped version of the method.
 
     """
-    # Create the interceptor once with reference to original method
-    recursive_interceptor = _create_recursive_interceptor(executing_instances, original_method)
+    import inspect
+
+    key = (id(cls_or_obj), method_name)
 
     if inspect.iscoroutinefunction(original_method):
 
         @functools.wraps(original_method)
-        async def async_wrapper(self, *args, **kwargs):
-            # Check if already executing - return first arg if so
-            # Handle case where object can't be hashed yet (e.g., during __init__)
-            try:
-                is_executing = self in executing_instances
-            except (AttributeError, TypeError):
-                is_executing = False
-
-            if is_executing:
+        async def async_wrapper(
+            self, *args, _orig=original_method, _key=key, _flight_var=_in_flight, **kwargs
+        ):
+            # Free variables are bound as defaults so the hot path uses
+            # LOAD_FAST instead of cell/global lookups
+            flight = _flight_var.get()
+            if _key in flight:
+                # Return first arg if recursive call detected
                 return args[0] if args else None
 
-            # Save current method and temporarily replace with interceptor
-            if inspect.isclass(cls_or_obj):
-                previous_method = getattr(cls_or_obj, method_name)
-                setattr(cls_or_obj, method_name, recursive_interceptor)
-            else:
-                previous_method = getattr(cls_or_obj, method_name)
-                setattr(cls_or_obj, method_name, recursive_interceptor)
-
-            # Mark instance as executing (if possible)
+            token = _flight_var.set(flight | {_key})
             try:
-                executing_instances.add(self)
-                added_to_set = True
-            except (AttributeError, TypeError):
-                # Object can't be hashed yet, proceed without recursion protection
-                added_to_set = False
-
-            try:
-                # Execute the original method
-                result = await original_method(self, *args, **kwargs)
-                return result
+                return await _orig(self, *args, **kwargs)
             except Exception as error:
-                if not should_track_error(error):
+                if _ERROR_REPORTING_DISABLED or not should_track_error(error):
                     raise error
 
+                import traceback
+
                 event_data = ErrorEventData(
                     method=method_name,
                     message=str(error),
-                    stack=traceback.format_exc(),
+                    stack="".join(
+                        traceback.format_exception(
+                            type(error), error, error.__traceback__, limit=20
+                        )
+                    ),
                     name="error",
                 )
 
@@ -336,57 +611,37 @@ def _create_error_tracking_wrapper(original_method, method_name, executing_insta
 
                 raise error
             finally:
-                # Always restore previous method and remove from executing set
-                if added_to_set:
-                    executing_instances.discard(self)
-                if inspect.isclass(cls_or_obj):
-                    setattr(cls_or_obj, method_name, previous_method)
-                else:
-                    setattr(cls_or_obj, method_name, previous_method)
+                _flight_var.reset(token)
 
         return async_wrapper
     else:
 
         @functools.wraps(original_method)
-        def sync_wrapper(self, *args, **kwargs):
-            # Check if already executing - return first arg if so
-            # Handle case where object can't be hashed yet (e.g., during __init__)
-            try:
-                is_executing = self in executing_instances
-            except (AttributeError, TypeError):
-                is_executing = False
-
-            if is_executing:
+        def sync_wrapper(
+            self, *args, _orig=original_method, _key=key, _flight_var=_in_flight, **kwargs
+        ):
+            flight = _flight_var.get()
+            if _key in flight:
+                # Return first arg if recursive call detected
                 return args[0] if args else None
 
-            # Save current method and temporarily replace with interceptor
-            if inspect.isclass(cls_or_obj):
-                previous_method = getattr(cls_or_obj, method_name)
-                setattr(cls_or_obj, method_name, recursive_interceptor)
-            else:
-                previous_method = getattr(cls_or_obj, method_name)
-                setattr(cls_or_obj, method_name, recursive_interceptor)
-
-            # Mark instance as executing (if possible)
+            token = _flight_var.set(flight | {_key})
             try:
-                executing_instances.add(self)
-                added_to_set = True
-            except (AttributeError, TypeError):
-                # Object can't be hashed yet, proceed without recursion protection
-                added_to_set = False
-
-            try:
-                # Execute the original method
-                result = original_method(self, *args, **kwargs)
-                return result
+                return _orig(self, *args, **kwargs)
             except Exception as error:
-                if not should_track_error(error):
+                if _ERROR_REPORTING_DISABLED or not should_track_error(error):
                     raise error
 
+                import traceback
+
                 event_data = ErrorEventData(
                     method=method_name,
                     message=str(error),
-                    stack=traceback.format_exc(),
+                    stack="".join(
+                        traceback.format_exception(
+                            type(error), error, error.__traceback__, limit=20
+                        )
+                    ),
                     name="error",
                 )
 
@@ -395,13 +650,7 @@ def _create_error_tracking_wrapper(original_method, method_name, executing_insta
 
                 raise error
             finally:
-                # Always restore previous method and remove from executing set
-                if added_to_set:
-                    executing_instances.discard(self)
-                if inspect.isclass(cls_or_obj):
-                    setattr(cls_or_obj, method_name, previous_method)
-                else:
-                    setattr(cls_or_obj, method_name, previous_method)
+                _flight_var.reset(token)
 
         return sync_wrapper
 
@@ -416,6 +665,8 @@ def wrap_with_error_tracking(func):
         The wrapped function.
 
     """
+    import inspect
+
     if inspect.iscoroutinefunction(func):
         # Original function is async
         @functools.wraps(func)
@@ -423,13 +674,19 @@ def wrap_with_error_tracking(func):
             try:
                 return await func(*args, **kwargs)
             except Exception as error:
-                if not should_track_error(error):
+                if _ERROR_REPORTING_DISABLED or not should_track_error(error):
                     raise error
 
+                import traceback
+
                 event_data = ErrorEventData(
                     method=func.__name__,
                     message=str(error),
-                    stack=traceback.format_exc(),
+                    stack="".join(
+                        traceback.format_exception(
+                            type(error), error, error.__traceback__, limit=20
+                        )
+                    ),
                     name="error",
                 )
 
@@ -446,13 +703,19 @@ def wrap_with_error_tracking(func):
             try:
                 return func(*args, **kwargs)
             except Exception as error:
-                if not should_track_error(error):
+                if _ERROR_REPORTING_DISABLED or not should_track_error(error):
                     raise error
 
+                import traceback
+
                 event_data = ErrorEventData(
                     method=func.__name__,
                     message=str(error),
-                    stack=traceback.format_exc(),
+                    stack="".join(
+                        traceback.format_exception(
+                            type(error), error, error.__traceback__, limit=20
+                        )
+                    ),
                     name="error",
                 )
 
@@ -468,7 +731,7 @@ def wrap_with_error_tracking(func):
 def wrap_class_with_error_tracking(cls):
     """Wrap all methods of a class with error tracking.
 
-    Uses WeakSet-based recursion protection to prevent memory leaks and stack overflow
+    Uses ContextVar-based recursion protection to prevent stack overflow
     when methods call themselves via ClassName.method_name.
 
     Args:
@@ -478,22 +741,28 @@ def wrap_class_with_error_tracking(cls):
         The class with wrapped methods.
 
     """
-    if os.getenv("DISABLE_CDP_ERROR_REPORTING") == "true":
+    if _ERROR_REPORTING_DISABLED:
         return cls
 
-    for name, _ in inspect.getmembers(cls, inspect.isfunction):
-        if not name.startswith("__"):
-            current_method = getattr(cls, name)
-            original_method = _get_original_method(current_method)
-            executing_instances = weakref.WeakSet()
+    import inspect
+
+    # Iterate the class dict directly: no MRO traversal or descriptor getattr
+    # per attribute, and plain functions are picked out without inspect.getmembers
+    for name, method in list(vars(cls).items()):
+        if name.startswith("__") or not inspect.isfunction(method):
+            continue
 
-            wrapped_method = _create_error_tracking_wrapper(
-                original_method, name, executing_instances, cls
-            )
+        original_method = _get_original_method(method)
 
-            # Store original method reference
-            setattr(wrapped_method, _ORIGINAL_METHOD, original_method)
-            setattr(cls, name, wrapped_method)
+        if getattr(original_method, _NO_RECURSION, False):
+            # No recursion bookkeeping needed: just the error-tracking try/except
+            wrapped_method = wrap_with_error_tracking(original_method)
+        else:
+            wrapped_method = _create_error_tracking_wrapper(original_method, name, cls)
+
+        # Store original method reference
+        setattr(wrapped_method, _ORIGINAL_METHOD, original_method)
+        setattr(cls, name, wrapped_method)
 
     return cls
 
@@ -512,15 +781,38 @@ def wrap_class_with_error_tracking_deprecated(cls):
         The class with wrapped methods.
 
     """
-    if os.getenv("DISABLE_CDP_ERROR_REPORTING") == "true":
+    if _ERROR_REPORTING_DISABLED:
         return cls
 
+    import inspect
+
     for name, method in inspect.getmembers(cls, inspect.isfunction):
         if not name.startswith("__"):
             setattr(cls, name, wrap_with_error_tracking(method))
     return cls
 
 
+@functools.lru_cache(maxsize=64)
+def _base_decision(error_type: type) -> bool | None:
+    """Decide trackability from the exception type alone, where possible.
+
+    Args:
+        error_type: The exception class to check.
+
+    Returns:
+        True/False when the type fully determines the decision, or None when
+        the instance's error_type field must be inspected (ApiError).
+
+    """
+    if issubclass(error_type, UserInputValidationError):
+        return False
+
+    if issubclass(error_type, NetworkError):
+        return True
+
+    return None
+
+
 def should_track_error(error: Exception) -> bool:
     """Determine if an error should be tracked.
 
@@ -531,11 +823,9 @@ def should_track_error(error: Exception) -> bool:
         True if the error should be tracked, False otherwise.
 
     """
-    if isinstance(error, UserInputValidationError):
-        return False
-
-    if isinstance(error, NetworkError):
-        return True
+    decision = _base_decision(type(error))
+    if decision is not None:
+        return decision
 
     if isinstance(error, ApiError) and error.error_type != HttpErrorType.UNEXPECTED_ERROR:  # noqa: SIM103
         return False
@@ -0,0 +1,75 @@
+"""Small async-friendly caches used to short-circuit repeated API reads."""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any
+
+_MISSING = object()
+
+
+class AsyncTTLCache:
+    """A bounded LRU cache whose entries expire after a per-entry TTL.
+
+    Designed for caching results of idempotent API reads: entries are keyed on
+    the request parameters, evicted least-recently-used once `maxsize` is
+    reached, and dropped once their TTL elapses.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 5.0) -> None:
+        """Initialize the cache.
+
+        Args:
+            maxsize (int): The maximum number of entries to keep.
+            ttl (float): The default time-to-live for entries, in seconds.
+
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[Any, tuple[float, Any]] = OrderedDict()
+        self._lock = asyncio.Lock()
+
+    async def get(self, key: Any) -> Any:
+        """Return the cached value for `key`, or None if absent or expired.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            The cached value, or None.
+
+        """
+        async with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    async def set(self, key: Any, value: Any, ttl: float | None = None) -> None:
+        """Store `value` under `key`.
+
+        Args:
+            key: The cache key.
+            value: The value to cache.
+            ttl (float | None): Time-to-live in seconds; defaults to the
+                cache-wide TTL. Pass `float("inf")` for entries that never
+                expire (e.g. immutable terminal states).
+
+        """
+        async with self._lock:
+            self._entries[key] = (time.monotonic() + (ttl if ttl is not None else self.ttl), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    async def clear(self) -> None:
+        """Drop all cached entries."""
+        async with self._lock:
+            self._entries.clear()
@@ -1,7 +1,7 @@
 import os
 
 from cdp.__version__ import __version__
-from cdp.analytics import Analytics, wrap_class_with_error_tracking
+from cdp.analytics import Analytics, set_session_provider, wrap_class_with_error_tracking
 from cdp.api_clients import ApiClients
 from cdp.constants import SDK_DEFAULT_SOURCE
 from cdp.end_user_client import EndUserClient
@@ -89,6 +89,9 @@ For more information, see: https://github.com/coinbase/cdp-sdk/blob/main/python/
         )
         self.api_clients = ApiClients(self.cdp_api_client)
 
+        # Let analytics reuse the SDK's connection pool instead of its own
+        set_session_provider(lambda: self.cdp_api_client.rest_client.pool_manager)
+
         self._evm = EvmClient(self.api_clients)
         self._solana = SolanaClient(self.api_clients)
         self._policies = PoliciesClient(self.api_clients)
@@ -106,6 +109,7 @@ For more information, see: https://github.com/coinbase/cdp-sdk/blob/main/python/
             wrap_class_with_error_tracking(EvmClient)
             wrap_class_with_error_tracking(SolanaClient)
             wrap_class_with_error_tracking(PoliciesClient)
+            wrap_class_with_error_tracking(EndUserClient)
 
     @property
     def evm(self) -> EvmClient:
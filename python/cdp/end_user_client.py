@@ -1,6 +1,9 @@
+import asyncio
 import uuid
+from collections.abc import AsyncIterator
+from typing import Any
 
-from cdp.analytics import track_action
+from cdp.analytics import no_recursion_needed, track_action
 from cdp.api_clients import ApiClients
 from cdp.openapi_client.models.authentication_method import AuthenticationMethod
 from cdp.openapi_client.models.create_end_user_request import CreateEndUserRequest
@@ -25,6 +28,8 @@ class ListEndUsersResult:
 
     """
 
+    __slots__ = ("end_users", "next_page_token")
+
     def __init__(self, end_users: list[EndUser], next_page_token: str | None = None):
         self.end_users = end_users
         self.next_page_token = next_page_token
@@ -36,6 +41,7 @@ class EndUserClient:
     def __init__(self, api_clients: ApiClients):
         self.api_clients = api_clients
 
+    @no_recursion_needed
     async def create_end_user(
         self,
         authentication_methods: list[AuthenticationMethod],
@@ -60,12 +66,76 @@ class EndUserClient:
         """
         track_action(action="create_end_user")
 
-        # Generate UUID if user_id not provided
+        return await self._create_end_user(
+            authentication_methods=authentication_methods,
+            user_id=user_id,
+            evm_account=evm_account,
+            solana_account=solana_account,
+        )
+
+    @no_recursion_needed
+    async def create_end_users_bulk(
+        self,
+        specs: list[dict[str, Any]],
+        concurrency: int = 16,
+    ) -> list[EndUser | BaseException]:
+        """Create multiple end users concurrently.
+
+        Requests are issued in parallel over the shared connection pool, with
+        at most `concurrency` creates in flight at a time to bound server load.
+
+        Args:
+            specs: A list of keyword-argument dicts, one per end user, each
+                accepting the same keys as `create_end_user`.
+            concurrency: The maximum number of concurrent create requests.
+
+        Returns:
+            list[EndUser | BaseException]: The created end users in the order of
+            `specs`; a failed create yields its exception at that position.
+
+        """
+        track_action(action="create_end_users_bulk", properties={"count": len(specs)})
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _create_one(spec: dict[str, Any]) -> EndUser:
+            async with semaphore:
+                return await self._create_end_user(**spec)
+
+        return await asyncio.gather(
+            *(_create_one(spec) for spec in specs),
+            return_exceptions=True,
+        )
+
+    async def _create_end_user(
+        self,
+        authentication_methods: list[AuthenticationMethod],
+        user_id: str | None = None,
+        evm_account: CreateEndUserRequestEvmAccount | None = None,
+        solana_account: CreateEndUserRequestSolanaAccount | None = None,
+    ) -> EndUser:
+        """Create an end user without emitting an analytics event.
+
+        Args:
+            authentication_methods: The list of authentication methods for the end user.
+            user_id: Optional unique identifier for the end user. If not provided, a UUID is generated.
+            evm_account: Optional configuration for creating an EVM account for the end user.
+            solana_account: Optional configuration for creating a Solana account for the end user.
+
+        Returns:
+            EndUser: The created end user.
+
+        """
+        # Generate UUID if user_id not provided; the 32-char hex form skips the
+        # dash insertion of str(uuid4) and is valid for the userId constraints
         if user_id is None:
-            user_id = str(uuid.uuid4())
+            user_id = uuid.uuid4().hex
 
+        # model_construct skips pydantic revalidation: the submodels were
+        # already validated when the caller built them, and the server
+        # enforces the user_id constraints authoritatively
         return await self.api_clients.end_user.create_end_user(
-            create_end_user_request=CreateEndUserRequest(
+            create_end_user_request=CreateEndUserRequest.model_construct(
                 user_id=user_id,
                 authentication_methods=authentication_methods,
                 evm_account=evm_account,
@@ -73,6 +143,7 @@ class EndUserClient:
             ),
         )
 
+    @no_recursion_needed
     async def list_end_users(
         self,
         page_size: int | None = None,
@@ -103,6 +174,43 @@ class EndUserClient:
             next_page_token=response.next_page_token,
         )
 
+    async def iter_end_users(
+        self,
+        page_size: int = 100,
+        sort: list[str] | None = None,
+    ) -> AsyncIterator[EndUser]:
+        """Iterate over all end users, following pagination transparently.
+
+        Unlike `list_end_users`, this yields users one at a time and only ever
+        holds a single page in memory, so it is the preferred way to process
+        large numbers of end users.
+
+        Args:
+            page_size (int, optional): The number of end users to fetch per page. Defaults to 100.
+            sort (List[str] | None, optional): Sort end users. Defaults to ascending order (oldest first). Defaults to None.
+
+        Yields:
+            EndUser: Each end user in the developer's CDP Project.
+
+        """
+        track_action(action="iter_end_users")
+
+        page_token = None
+        while True:
+            response = await self.api_clients.end_user.list_end_users(
+                page_size=page_size,
+                page_token=page_token,
+                sort=sort,
+            )
+
+            for end_user in response.end_users:
+                yield end_user
+
+            page_token = response.next_page_token
+            if not page_token:
+                break
+
+    @no_recursion_needed
     async def validate_access_token(
         self,
         access_token: str,
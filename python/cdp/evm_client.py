@@ -579,7 +579,9 @@ class EvmClient:
         response = await self.api_clients.evm_smart_accounts.list_evm_smart_accounts(
             page_size=page_size, page_token=page_token
         )
-        return ListEvmSmartAccountsResponse(
+        # model_construct skips re-validating the page of already-validated
+        # account models, which matters for large pages
+        return ListEvmSmartAccountsResponse.model_construct(
             accounts=response.accounts,
             next_page_token=response.next_page_token,
         )
@@ -1,3 +1,8 @@
+import asyncio
+import contextlib
+import functools
+import sys
+from contextvars import ContextVar
 from typing import TYPE_CHECKING, Any
 
 from eth_account.signers.base import BaseAccount
@@ -8,6 +13,12 @@ from cdp.actions.evm.request_faucet import request_faucet
 from cdp.actions.evm.send_user_operation import send_user_operation
 from cdp.actions.evm.sign_and_wrap_typed_data_for_smart_account import (
     SignAndWrapTypedDataForSmartAccountOptions,
+    sign_and_wrap_typed_data_for_smart_account,
+)
+from cdp.actions.evm.swap.create_swap_quote import create_swap_quote
+from cdp.actions.evm.swap.send_swap_operation import (
+    SendSwapOperationOptions,
+    send_swap_operation,
 )
 from cdp.actions.evm.swap.types import (
     QuoteSwapResult,
@@ -17,21 +28,122 @@ from cdp.actions.evm.swap.types import (
 from cdp.actions.evm.wait_for_user_operation import wait_for_user_operation
 from cdp.analytics import track_action
 from cdp.api_clients import ApiClients
+from cdp.cache import AsyncTTLCache
 from cdp.evm_call_types import ContractCall
 from cdp.evm_message_types import EIP712Domain
 from cdp.evm_token_balances import ListTokenBalancesResult
+from cdp.network_config import NETWORK_TO_CHAIN_ID, get_chain_id
 from cdp.openapi_client.models.evm_smart_account import EvmSmartAccount as EvmSmartAccountModel
 from cdp.openapi_client.models.evm_user_operation import EvmUserOperation as EvmUserOperationModel
+from cdp.utils import AsyncSingleFlight
 
 # Avoid circular imports
 if TYPE_CHECKING:
     from cdp.spend_permissions import SpendPermissionInput
 
+# A user operation in one of these states can never change again, so it is
+# safe to cache indefinitely
+_TERMINAL_USER_OP_STATUSES = frozenset({"complete", "failed"})
 
-class EvmSmartAccount(BaseModel):
-    """A class representing an EVM smart account."""
+# How long a list_token_balances page stays fresh
+_TOKEN_BALANCES_TTL_SECONDS = 5.0
 
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+# Ambient ApiClients shared by accounts constructed without their own
+_CURRENT_API_CLIENTS: ContextVar[ApiClients | None] = ContextVar(
+    "cdp_current_api_clients", default=None
+)
+
+
+@contextlib.contextmanager
+def use_api_clients(api_clients: ApiClients):
+    """Set the ambient ApiClients used by accounts that were built without one.
+
+    In practice every account in a process talks through the same client, so
+    accounts constructed without an explicit `api_clients` (e.g. via
+    `to_evm_smart_account`) fall back to the one installed here.
+
+    Args:
+        api_clients (ApiClients): The API clients to install for the block.
+
+    """
+    token = _CURRENT_API_CLIENTS.set(api_clients)
+    try:
+        yield api_clients
+    finally:
+        _CURRENT_API_CLIENTS.reset(token)
+
+
+@functools.lru_cache(maxsize=32)
+def _network_properties(network: str) -> dict[str, str]:
+    """Return the telemetry properties dict for a network.
+
+    The handful of network names recur on every call, so the dict is built
+    once per network and shared; track_action leaves plain network names
+    untouched. URL-shaped networks are copied in `_track` because
+    track_action rewrites those in place.
+    """
+    return {"network": sys.intern(network)}
+
+
+def _track(action: str, network: str | None = None) -> None:
+    """Record an analytics action for this account type."""
+    properties = None
+    if network is not None:
+        properties = _network_properties(network)
+        if network.startswith("http"):
+            # track_action replaces the network with "custom" and adds the
+            # RPC host in place; give it a copy so the cached dict stays pristine
+            properties = dict(properties)
+    track_action(
+        action=action,
+        account_type="evm_smart",
+        properties=properties,
+    )
+
+
+@functools.cache
+def _transfer_action():
+    """Resolve the transfer action once; imported lazily to break a circular import."""
+    from cdp.actions.evm.transfer import smart_account_transfer_strategy, transfer
+
+    return transfer, smart_account_transfer_strategy
+
+
+@functools.cache
+def _use_spend_permission_action():
+    """Resolve the spend-permission action once; imported lazily to break a circular import."""
+    from cdp.actions.evm.spend_permissions import smart_account_use_spend_permission
+
+    return smart_account_use_spend_permission
+
+
+@functools.cache
+def _network_scoped_account_class():
+    """Resolve NetworkScopedEvmSmartAccount once; imported lazily to break a circular import."""
+    from cdp.network_scoped_evm_smart_account import NetworkScopedEvmSmartAccount
+
+    return NetworkScopedEvmSmartAccount
+
+
+class EvmSmartAccount:
+    """A class representing an EVM smart account.
+
+    A plain slotted class rather than a Pydantic model: instances are built
+    from already-validated API responses (often hundreds per listing page),
+    so field validation would be pure overhead.
+    """
+
+    __slots__ = (
+        "_address",
+        "_owners",
+        "_name",
+        "_policies",
+        "_api_clients",
+        "_single_flight",
+        "_read_cache",
+        "_get_user_op",
+        "_onchain_data",
+    )
 
     def __init__(
         self,
@@ -51,13 +163,35 @@ class EvmSmartAccount(BaseModel):
             api_clients (ApiClients | None): The API client.
 
         """
-        super().__init__()
+        self._address = sys.intern(address)
+        self._owners = [owner]
+        self._name = name
+        self._policies = policies
+        self._api_clients = api_clients
+        # Coalesces concurrent identical reads into one API round trip
+        self._single_flight = AsyncSingleFlight()
+        # Short-circuits repeat reads; user operations are only cached once
+        # they reach a terminal status
+        self._read_cache = AsyncTTLCache(maxsize=1024, ttl=_TOKEN_BALANCES_TTL_SECONDS)
+        # Pre-bound hot-path callables, saving two attribute hops per call
+        if api_clients is not None:
+            self._get_user_op = api_clients.evm_smart_accounts.get_user_operation
+            self._onchain_data = api_clients.onchain_data
+        else:
+            self._get_user_op = None
+            self._onchain_data = None
 
-        self.__address = address
-        self.__owners = [owner]
-        self.__name = name
-        self.__policies = policies
-        self.__api_clients = api_clients
+    @property
+    def api_clients(self) -> ApiClients | None:
+        """Get the API clients this account talks through.
+
+        Returns:
+            ApiClients | None: The per-instance clients if provided at
+            construction, otherwise the ambient default installed via
+            `use_api_clients`.
+
+        """
+        return self._api_clients or _CURRENT_API_CLIENTS.get()
 
     @property
     def address(self) -> str:
@@ -67,7 +201,7 @@ class EvmSmartAccount(BaseModel):
             str: The Smart Account Address.
 
         """
-        return self.__address
+        return self._address
 
     @property
     def owners(self) -> list[BaseAccount]:
@@ -77,7 +211,7 @@ class EvmSmartAccount(BaseModel):
             List[BaseAccount]: List of owner accounts
 
         """
-        return self.__owners
+        return self._owners
 
     @property
     def name(self) -> str | None:
@@ -87,7 +221,7 @@ class EvmSmartAccount(BaseModel):
             str | None: The name of the smart account.
 
         """
-        return self.__name
+        return self._name
 
     @property
     def policies(self) -> list[str] | None:
@@ -97,7 +231,7 @@ class EvmSmartAccount(BaseModel):
             list[str] | None: The list of Policy IDs.
 
         """
-        return self.__policies
+        return self._policies
 
     async def transfer(
         self,
@@ -152,21 +286,14 @@ class EvmSmartAccount(BaseModel):
             ... })
 
         """
-        track_action(
-            action="transfer",
-            account_type="evm_smart",
-            properties={
-                "network": network,
-            },
-        )
+        network = sys.intern(network)
+        token = sys.intern(token)
+        _track("transfer", network)
 
-        from cdp.actions.evm.transfer import (
-            smart_account_transfer_strategy,
-            transfer,
-        )
+        transfer, smart_account_transfer_strategy = _transfer_action()
 
         return await transfer(
-            api_clients=self.__api_clients,
+            api_clients=self.api_clients,
             from_account=self,
             to=to,
             amount=amount,
@@ -193,21 +320,27 @@ class EvmSmartAccount(BaseModel):
             [ListTokenBalancesResult]: The token balances for the smart account on the network.
 
         """
-        track_action(
-            action="list_token_balances",
-            account_type="evm_smart",
-            properties={
-                "network": network,
-            },
-        )
-
-        return await list_token_balances(
-            self.__api_clients.onchain_data,
-            self.address,
-            network,
-            page_size,
-            page_token,
+        network = sys.intern(network)
+        _track("list_token_balances", network)
+
+        cache_key = ("list_token_balances", network, page_size, page_token)
+        cached = await self._read_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        onchain_data = self._onchain_data or self.api_clients.onchain_data
+        result = await self._single_flight.run(
+            cache_key,
+            lambda: list_token_balances(
+                onchain_data,
+                self.address,
+                network,
+                page_size,
+                page_token,
+            ),
         )
+        await self._read_cache.set(cache_key, result)
+        return result
 
     async def request_faucet(
         self,
@@ -224,16 +357,12 @@ class EvmSmartAccount(BaseModel):
             str: The transaction hash of the faucet request.
 
         """
-        track_action(
-            action="request_faucet",
-            account_type="evm_smart",
-            properties={
-                "network": network,
-            },
-        )
+        network = sys.intern(network)
+        token = sys.intern(token)
+        _track("request_faucet", network)
 
         return await request_faucet(
-            self.__api_clients.faucets,
+            self.api_clients.faucets,
             self.address,
             network,
             token,
@@ -258,16 +387,11 @@ class EvmSmartAccount(BaseModel):
             EvmUserOperationModel: The user operation model.
 
         """
-        track_action(
-            action="send_user_operation",
-            account_type="evm_smart",
-            properties={
-                "network": network,
-            },
-        )
+        network = sys.intern(network)
+        _track("send_user_operation", network)
 
         return await send_user_operation(
-            self.__api_clients,
+            self.api_clients,
             self.address,
             self.owners[0],
             calls,
@@ -276,6 +400,41 @@ class EvmSmartAccount(BaseModel):
             data_suffix,
         )
 
+    async def bulk_send_user_operations(
+        self,
+        ops_list: list[dict[str, Any]],
+        max_concurrency: int = 16,
+    ) -> list[EvmUserOperationModel | BaseException]:
+        """Send multiple user operations concurrently.
+
+        Prefer this over a Python loop of sequential `await`s: independent
+        operations run in parallel over the shared connection pool, with at
+        most `max_concurrency` in flight at a time.
+
+        Args:
+            ops_list: A list of keyword-argument dicts, one per operation,
+                each accepting the same keys as `send_user_operation`.
+            max_concurrency: The maximum number of concurrent sends.
+
+        Returns:
+            list[EvmUserOperationModel | BaseException]: The user operations
+            in the order of `ops_list`; a failed send yields its exception at
+            that position.
+
+        """
+        _track("bulk_send_user_operations")
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _send_one(op: dict[str, Any]) -> EvmUserOperationModel:
+            async with semaphore:
+                return await self.send_user_operation(**op)
+
+        return await asyncio.gather(
+            *(_send_one(op) for op in ops_list),
+            return_exceptions=True,
+        )
+
     async def wait_for_user_operation(
         self,
         user_op_hash: str,
@@ -293,13 +452,10 @@ class EvmSmartAccount(BaseModel):
             EvmUserOperationModel: The user operation model.
 
         """
-        track_action(
-            action="wait_for_user_operation",
-            account_type="evm_smart",
-        )
+        _track("wait_for_user_operation")
 
         return await wait_for_user_operation(
-            self.__api_clients,
+            self.api_clients,
             self.address,
             user_op_hash,
             timeout_seconds,
@@ -316,14 +472,21 @@ class EvmSmartAccount(BaseModel):
             EvmUserOperationModel: The user operation model.
 
         """
-        track_action(
-            action="get_user_operation",
-            account_type="evm_smart",
-        )
+        _track("get_user_operation")
 
-        return await self.__api_clients.evm_smart_accounts.get_user_operation(
-            self.address, user_op_hash
+        cache_key = ("get_user_operation", user_op_hash)
+        cached = await self._read_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        get_user_op = self._get_user_op or self.api_clients.evm_smart_accounts.get_user_operation
+        result = await self._single_flight.run(
+            cache_key,
+            lambda: get_user_op(self.address, user_op_hash),
         )
+        if result.status in _TERMINAL_USER_OP_STATUSES:
+            await self._read_cache.set(cache_key, result, ttl=float("inf"))
+        return result
 
     async def swap(
         self,
@@ -384,18 +547,7 @@ class EvmSmartAccount(BaseModel):
             ```
 
         """
-        track_action(
-            action="swap",
-            account_type="evm_smart",
-            properties={
-                "network": options.network,
-            },
-        )
-
-        from cdp.actions.evm.swap.send_swap_operation import (
-            SendSwapOperationOptions,
-            send_swap_operation,
-        )
+        _track("swap", options.network)
 
         # Convert SmartAccountSwapOptions to SendSwapOperationOptions
         if options.swap_quote is not None:
@@ -427,7 +579,7 @@ class EvmSmartAccount(BaseModel):
             )
 
         return await send_swap_operation(
-            api_clients=self.__api_clients,
+            api_clients=self.api_clients,
             options=send_options,
         )
 
@@ -485,11 +637,9 @@ class EvmSmartAccount(BaseModel):
             properties={"network": network},
         )
 
-        from cdp.actions.evm.swap.create_swap_quote import create_swap_quote
-
         # Call create_swap_quote with smart account address as taker and owner address as signer
         return await create_swap_quote(
-            api_clients=self.__api_clients,
+            api_clients=self.api_clients,
             from_token=from_token,
             to_token=to_token,
             from_amount=from_amount,
@@ -523,24 +673,20 @@ class EvmSmartAccount(BaseModel):
             str: The signature of the typed data.
 
         """
-        track_action(
-            action="sign_typed_data",
-            account_type="evm_smart",
-            properties={
-                "network": network,
-            },
-        )
+        network = sys.intern(network)
+        _track("sign_typed_data", network)
 
-        from cdp.actions.evm.sign_and_wrap_typed_data_for_smart_account import (
-            sign_and_wrap_typed_data_for_smart_account,
-        )
-        from cdp.network_config import get_chain_id
+        # Direct dict lookup on the hot signing path; fall back to
+        # get_chain_id only to raise its standard unsupported-network error
+        chain_id = NETWORK_TO_CHAIN_ID.get(network)
+        if chain_id is None:
+            chain_id = get_chain_id(network)
 
         return await sign_and_wrap_typed_data_for_smart_account(
-            api_clients=self.__api_clients,
+            api_clients=self.api_clients,
             options=SignAndWrapTypedDataForSmartAccountOptions(
                 smart_account=self,
-                chain_id=get_chain_id(network),
+                chain_id=chain_id,
                 typed_data={
                     "domain": domain,
                     "types": types,
@@ -595,19 +741,13 @@ class EvmSmartAccount(BaseModel):
             ... )
 
         """
-        from cdp.actions.evm.spend_permissions import smart_account_use_spend_permission
-        from cdp.analytics import track_action
+        network = sys.intern(network)
+        _track("use_spend_permission", network)
 
-        track_action(
-            action="use_spend_permission",
-            account_type="evm_smart",
-            properties={
-                "network": network,
-            },
-        )
+        smart_account_use_spend_permission = _use_spend_permission_action()
 
         return await smart_account_use_spend_permission(
-            api_clients=self.__api_clients,
+            api_clients=self.api_clients,
             smart_account=self,
             spend_permission=spend_permission,
             value=value,
@@ -632,9 +772,7 @@ class EvmSmartAccount(BaseModel):
             ```
 
         """
-        from cdp.network_scoped_evm_smart_account import NetworkScopedEvmSmartAccount
-
-        return NetworkScopedEvmSmartAccount(self, network)
+        return _network_scoped_account_class()(self, network)
 
     def __str__(self) -> str:
         """Return a string representation of the EthereumAccount object.
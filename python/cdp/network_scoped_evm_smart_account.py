@@ -112,7 +112,7 @@ class NetworkScopedEvmSmartAccount:
             if paymaster_url is None and self._network in ["base", "base-sepolia"]:
                 try:
                     paymaster_url = await get_base_node_rpc_url(
-                        self._evm_smart_account._EvmSmartAccount__api_clients, self._network
+                        self._evm_smart_account.api_clients, self._network
                     )
                 except Exception:
                     # If Base Node RPC URL fails, continue without paymaster_url
@@ -141,7 +141,7 @@ class NetworkScopedEvmSmartAccount:
             if paymaster_url is None and self._network in ["base", "base-sepolia"]:
                 try:
                     paymaster_url = await get_base_node_rpc_url(
-                        self._evm_smart_account._EvmSmartAccount__api_clients, self._network
+                        self._evm_smart_account.api_clients, self._network
                     )
                 except Exception:
                     # If Base Node RPC URL fails, continue without paymaster_url
@@ -1,18 +1,38 @@
 # flake8: noqa
 
-# import apis into api package
-from cdp.openapi_client.api.evm_accounts_api import EVMAccountsApi
-from cdp.openapi_client.api.evm_smart_accounts_api import EVMSmartAccountsApi
-from cdp.openapi_client.api.evm_swaps_api import EVMSwapsApi
-from cdp.openapi_client.api.evm_token_balances_api import EVMTokenBalancesApi
-from cdp.openapi_client.api.end_user_accounts_api import EndUserAccountsApi
-from cdp.openapi_client.api.faucets_api import FaucetsApi
-from cdp.openapi_client.api.onchain_data_api import OnchainDataApi
-from cdp.openapi_client.api.onramp_api import OnrampApi
-from cdp.openapi_client.api.policy_engine_api import PolicyEngineApi
-from cdp.openapi_client.api.sqlapi_alpha_api import SQLAPIAlphaApi
-from cdp.openapi_client.api.solana_accounts_api import SolanaAccountsApi
-from cdp.openapi_client.api.solana_token_balances_api import SolanaTokenBalancesApi
-from cdp.openapi_client.api.webhooks_api import WebhooksApi
-from cdp.openapi_client.api.x402_facilitator_api import X402FacilitatorApi
+import importlib
 
+# Lazily import apis on first attribute access (PEP 562): most programs touch
+# only a couple of the generated sub-APIs, and each one pays Pydantic model
+# construction cost at import time.
+_LAZY_APIS = {
+    "EVMAccountsApi": "cdp.openapi_client.api.evm_accounts_api",
+    "EVMSmartAccountsApi": "cdp.openapi_client.api.evm_smart_accounts_api",
+    "EVMSwapsApi": "cdp.openapi_client.api.evm_swaps_api",
+    "EVMTokenBalancesApi": "cdp.openapi_client.api.evm_token_balances_api",
+    "EndUserAccountsApi": "cdp.openapi_client.api.end_user_accounts_api",
+    "FaucetsApi": "cdp.openapi_client.api.faucets_api",
+    "OnchainDataApi": "cdp.openapi_client.api.onchain_data_api",
+    "OnrampApi": "cdp.openapi_client.api.onramp_api",
+    "PolicyEngineApi": "cdp.openapi_client.api.policy_engine_api",
+    "SQLAPIAlphaApi": "cdp.openapi_client.api.sqlapi_alpha_api",
+    "SolanaAccountsApi": "cdp.openapi_client.api.solana_accounts_api",
+    "SolanaTokenBalancesApi": "cdp.openapi_client.api.solana_token_balances_api",
+    "WebhooksApi": "cdp.openapi_client.api.webhooks_api",
+    "X402FacilitatorApi": "cdp.openapi_client.api.x402_facilitator_api",
+}
+
+__all__ = tuple(_LAZY_APIS)
+
+
+def __getattr__(name):
+    module_path = _LAZY_APIS.get(name)
+    if module_path is not None:
+        value = getattr(importlib.import_module(module_path), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_APIS))
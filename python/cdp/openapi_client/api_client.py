@@ -19,6 +19,22 @@ from enum import Enum
 import decimal
 import json
 import mimetypes
+
+try:
+    import orjson as _orjson  # optional accelerated JSON decoding
+except ImportError:
+    _orjson = None
+
+_json_loads = _orjson.loads if _orjson is not None else json.loads
+
+import functools
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_model_class(name):
+    """Resolve a response-type name to its model class once per name."""
+    import cdp.openapi_client.models
+    return getattr(cdp.openapi_client.models, name)
 import os
 import re
 import tempfile
@@ -405,14 +421,14 @@ class ApiClient:
         # fetch data from response object
         if content_type is None:
             try:
-                data = json.loads(response_text)
+                data = _json_loads(response_text)
             except ValueError:
                 data = response_text
         elif re.match(r'^application/(json|[\w!#$&.+-^_]+\+json)\s*(;|$)', content_type, re.IGNORECASE):
             if response_text == "":
                 data = ""
             else:
-                data = json.loads(response_text)
+                data = _json_loads(response_text)
         elif re.match(r'^text\/[a-z.+-]+\s*(;|$)', content_type, re.IGNORECASE):
             data = response_text
         else:
@@ -453,7 +469,7 @@ class ApiClient:
             if klass in self.NATIVE_TYPES_MAPPING:
                 klass = self.NATIVE_TYPES_MAPPING[klass]
             else:
-                klass = getattr(cdp.openapi_client.models, klass)
+                klass = _resolve_model_class(klass)
 
         if klass in self.PRIMITIVE_TYPES:
             return self.__deserialize_primitive(data, klass)
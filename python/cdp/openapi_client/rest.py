@@ -22,6 +22,11 @@ from typing import Optional, Union
 import aiohttp
 import aiohttp_retry
 
+try:
+    import orjson as _orjson  # optional accelerated JSON encoding
+except ImportError:
+    _orjson = None
+
 from cdp.openapi_client.exceptions import ApiException, ApiValueError
 
 RESTResponseType = aiohttp.ClientResponse
@@ -146,7 +151,16 @@ class RESTClientObject:
         if method in ['POST', 'PUT', 'PATCH', 'OPTIONS', 'DELETE']:
             if re.search('json', headers['Content-Type'], re.IGNORECASE):
                 if body is not None:
-                    body = json.dumps(body)
+                    if _orjson is not None:
+                        try:
+                            # orjson emits bytes, which aiohttp accepts directly
+                            body = _orjson.dumps(body)
+                        except TypeError:
+                            # orjson rejects integers outside 64 bits
+                            # (e.g. uint256 values); stdlib json handles them
+                            body = json.dumps(body)
+                    else:
+                        body = json.dumps(body)
                 args["data"] = body
             elif headers['Content-Type'] == 'application/x-www-form-urlencoded':
                 args["data"] = aiohttp.FormData(post_params)
@@ -190,7 +204,15 @@ class RESTClientObject:
         # https pool manager
         if self.pool_manager is None:
             self.pool_manager = aiohttp.ClientSession(
-                connector=aiohttp.TCPConnector(limit=self.maxsize, ssl=self.ssl_context),
+                connector=aiohttp.TCPConnector(
+                    limit=self.maxsize,
+                    ssl=self.ssl_context,
+                    # Keep idle connections warm so polling loops and
+                    # back-to-back calls skip the TCP/TLS handshake
+                    keepalive_timeout=75,
+                    ttl_dns_cache=300,
+                    enable_cleanup_closed=True,
+                ),
                 trust_env=True,
             )
         pool_manager = self.pool_manager
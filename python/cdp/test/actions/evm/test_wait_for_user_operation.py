@@ -1,3 +1,4 @@
+from itertools import pairwise
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -11,10 +12,10 @@ from cdp.openapi_client.models.evm_user_operation import EvmUserOperation
 @pytest.mark.asyncio
 @patch("cdp.actions.evm.wait_for_user_operation.time")
 @patch("cdp.cdp_client.ApiClients")
-async def test_wait_for_user_operation_success_immediate(mock_api_clients, mock_time):
+@patch("cdp.actions.evm.wait_for_user_operation.asyncio.sleep", new_callable=AsyncMock)
+async def test_wait_for_user_operation_success_immediate(mock_sleep, mock_api_clients, mock_time):
     """Test successful completion of a user operation that is already complete."""
     mock_time.time.return_value = 1000
-    mock_time.sleep = MagicMock()
 
     mock_smart_account = MagicMock(spec=EvmSmartAccount)
     mock_smart_account.address = "0x1234567890123456789012345678901234567890"
@@ -37,16 +38,16 @@ async def test_wait_for_user_operation_success_immediate(mock_api_clients, mock_
     mock_api_clients.evm_smart_accounts.get_user_operation.assert_called_once_with(
         mock_smart_account.address, mock_user_op.user_op_hash
     )
-    mock_time.sleep.assert_not_called()
+    mock_sleep.assert_not_called()
 
 
 @pytest.mark.asyncio
 @patch("cdp.actions.evm.wait_for_user_operation.time")
 @patch("cdp.cdp_client.ApiClients")
-async def test_wait_for_user_operation_success_after_poll(mock_api_clients, mock_time):
+@patch("cdp.actions.evm.wait_for_user_operation.asyncio.sleep", new_callable=AsyncMock)
+async def test_wait_for_user_operation_success_after_poll(mock_sleep, mock_api_clients, mock_time):
     """Test successful completion of a user operation after polling."""
     mock_time.time.side_effect = [1000, 1000.5, 1001]
-    mock_time.sleep = MagicMock()
 
     mock_smart_account = MagicMock(spec=EvmSmartAccount)
     mock_smart_account.address = "0x1234567890123456789012345678901234567890"
@@ -73,16 +74,16 @@ async def test_wait_for_user_operation_success_after_poll(mock_api_clients, mock
 
     assert result == mock_updated_op
     assert mock_api_clients.evm_smart_accounts.get_user_operation.call_count == 2
-    mock_time.sleep.assert_called_once_with(0.2)
+    mock_sleep.assert_called_once_with(0.2)
 
 
 @pytest.mark.asyncio
 @patch("cdp.actions.evm.wait_for_user_operation.time")
 @patch("cdp.cdp_client.ApiClients")
-async def test_wait_for_user_operation_failed_status(mock_api_clients, mock_time):
+@patch("cdp.actions.evm.wait_for_user_operation.asyncio.sleep", new_callable=AsyncMock)
+async def test_wait_for_user_operation_failed_status(mock_sleep, mock_api_clients, mock_time):
     """Test handling of a user operation that completes with 'failed' status."""
     mock_time.time.side_effect = [1000, 1000.5, 1001]
-    mock_time.sleep = MagicMock()
 
     mock_smart_account = MagicMock(spec=EvmSmartAccount)
     mock_smart_account.address = "0x1234567890123456789012345678901234567890"
@@ -109,13 +110,14 @@ async def test_wait_for_user_operation_failed_status(mock_api_clients, mock_time
 
     assert result == mock_updated_op
     assert mock_api_clients.evm_smart_accounts.get_user_operation.call_count == 2
-    mock_time.sleep.assert_called_once_with(0.2)
+    mock_sleep.assert_called_once_with(0.2)
 
 
 @pytest.mark.asyncio
 @patch("cdp.actions.evm.wait_for_user_operation.time")
 @patch("cdp.cdp_client.ApiClients")
-async def test_wait_for_user_operation_timeout(mock_api_clients, mock_time):
+@patch("cdp.actions.evm.wait_for_user_operation.asyncio.sleep", new_callable=AsyncMock)
+async def test_wait_for_user_operation_timeout(mock_sleep, mock_api_clients, mock_time):
     """Test timeout for a user operation that never completes."""
     start_time = 1000
 
@@ -140,7 +142,6 @@ async def test_wait_for_user_operation_timeout(mock_api_clients, mock_time):
     ]
 
     mock_time.time.side_effect = time_values
-    mock_time.sleep = MagicMock()
 
     mock_smart_account = MagicMock(spec=EvmSmartAccount)
     mock_smart_account.address = "0x1234567890123456789012345678901234567890"
@@ -161,16 +162,16 @@ async def test_wait_for_user_operation_timeout(mock_api_clients, mock_time):
         )
 
     assert mock_api_clients.evm_smart_accounts.get_user_operation.call_count > 1
-    assert mock_time.sleep.call_count > 1
+    assert mock_sleep.call_count > 1
 
 
 @pytest.mark.asyncio
 @patch("cdp.actions.evm.wait_for_user_operation.time")
 @patch("cdp.cdp_client.ApiClients")
-async def test_wait_for_user_operation_api_error(mock_api_clients, mock_time):
+@patch("cdp.actions.evm.wait_for_user_operation.asyncio.sleep", new_callable=AsyncMock)
+async def test_wait_for_user_operation_api_error(mock_sleep, mock_api_clients, mock_time):
     """Test handling of API errors during polling."""
     mock_time.time.side_effect = [1000, 1000.5]
-    mock_time.sleep = MagicMock()
 
     mock_smart_account = MagicMock(spec=EvmSmartAccount)
     mock_smart_account.address = "0x1234567890123456789012345678901234567890"
@@ -203,7 +204,10 @@ async def test_wait_for_user_operation_api_error(mock_api_clients, mock_time):
 @pytest.mark.asyncio
 @patch("cdp.actions.evm.wait_for_user_operation.time")
 @patch("cdp.cdp_client.ApiClients")
-async def test_wait_for_user_operation_custom_timeout_and_interval(mock_api_clients, mock_time):
+@patch("cdp.actions.evm.wait_for_user_operation.asyncio.sleep", new_callable=AsyncMock)
+async def test_wait_for_user_operation_custom_timeout_and_interval(
+    mock_sleep, mock_api_clients, mock_time
+):
     """Test using custom timeout and interval values."""
     start_time = 1000
     mock_time.time.side_effect = [
@@ -213,7 +217,6 @@ async def test_wait_for_user_operation_custom_timeout_and_interval(mock_api_clie
         start_time + 3,
         start_time + 11,
     ]
-    mock_time.sleep = MagicMock()
 
     mock_smart_account = MagicMock(spec=EvmSmartAccount)
     mock_smart_account.address = "0x1234567890123456789012345678901234567890"
@@ -233,16 +236,23 @@ async def test_wait_for_user_operation_custom_timeout_and_interval(mock_api_clie
             interval_seconds=1.0,
         )
 
-    mock_time.sleep.assert_called_with(1.0)
+    # The first delay is the configured interval; later delays back off
+    # exponentially up to the 2s ceiling (plus jitter)
+    delays = [call.args[0] for call in mock_sleep.call_args_list]
+    assert delays[0] == 1.0
+    assert all(earlier <= later or later >= 2.0 for earlier, later in pairwise(delays))
+    assert all(delay <= 2.0 * 1.1 for delay in delays)
 
 
 @pytest.mark.asyncio
 @patch("cdp.actions.evm.wait_for_user_operation.time")
 @patch("cdp.cdp_client.ApiClients")
-async def test_wait_for_user_operation_multiple_status_changes(mock_api_clients, mock_time):
+@patch("cdp.actions.evm.wait_for_user_operation.asyncio.sleep", new_callable=AsyncMock)
+async def test_wait_for_user_operation_multiple_status_changes(
+    mock_sleep, mock_api_clients, mock_time
+):
     """Test handling of a user operation that goes through multiple status changes."""
     mock_time.time.side_effect = [1000, 1000.5, 1001, 1001.5]
-    mock_time.sleep = MagicMock()
 
     mock_smart_account = MagicMock(spec=EvmSmartAccount)
     mock_smart_account.address = "0x1234567890123456789012345678901234567890"
@@ -273,16 +283,18 @@ async def test_wait_for_user_operation_multiple_status_changes(mock_api_clients,
 
     assert result == mock_complete_op
     assert mock_api_clients.evm_smart_accounts.get_user_operation.call_count == 3
-    assert mock_time.sleep.call_count == 2
+    assert mock_sleep.call_count == 2
 
 
 @pytest.mark.asyncio
 @patch("cdp.actions.evm.wait_for_user_operation.time")
 @patch("cdp.cdp_client.ApiClients")
-async def test_wait_for_user_operation_invalid_user_op_hash(mock_api_clients, mock_time):
+@patch("cdp.actions.evm.wait_for_user_operation.asyncio.sleep", new_callable=AsyncMock)
+async def test_wait_for_user_operation_invalid_user_op_hash(
+    mock_sleep, mock_api_clients, mock_time
+):
     """Test handling of an API error when user_op_hash is invalid."""
     mock_time.time.return_value = 1000
-    mock_time.sleep = MagicMock()
 
     mock_smart_account = MagicMock(spec=EvmSmartAccount)
     mock_smart_account.address = "0x1234567890123456789012345678901234567890"
@@ -36,3 +36,17 @@ def smart_account_factory(local_account_factory):
         return EvmSmartAccount(smart_account_address, account, name, policies)
 
     return _create_smart_account
+
+
+@pytest.fixture
+def smart_account_with_api(local_account_factory, api_clients_stub):
+    """Create and return a factory for smart accounts wired to the shared ApiClients stub."""
+
+    def _create_smart_account(
+        smart_account_address="0x1234567890123456789012345678901234567890",
+        name="test-smart-account",
+        account=local_account_factory,
+    ):
+        return EvmSmartAccount(smart_account_address, account, name, None, api_clients_stub)
+
+    return _create_smart_account
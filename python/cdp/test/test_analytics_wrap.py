@@ -19,6 +19,7 @@ import pytest
 
 from cdp.analytics import (
     Analytics,
+    _refresh_flags,
     wrap_class_with_error_tracking,
     wrap_class_with_error_tracking_deprecated,
 )
@@ -31,24 +32,16 @@ def reset_analytics(monkeypatch):
     Analytics["identifier"] = "test-id"
     # Ensure error reporting is enabled for these tests
     monkeypatch.delenv("DISABLE_CDP_ERROR_REPORTING", raising=False)
+    _refresh_flags()
     yield
-
-
-@pytest.fixture(autouse=True)
-def mock_aiohttp(monkeypatch):
-    """Mock aiohttp for all tests."""
-
-    # Mock the send_event function to avoid actual HTTP calls
-    async def mock_send_event(event):
-        pass
-
-    monkeypatch.setattr("cdp.analytics.send_event", mock_send_event)
+    _refresh_flags()
 
 
 class TestDeprecatedImplementationBugs:
     """Tests that reproduce the bug in the deprecated implementation."""
 
-    def test_method_calling_via_class_attribute_causes_recursion(self):
+    @pytest.mark.asyncio
+    async def test_method_calling_via_class_attribute_causes_recursion(self):
         """REPRODUCES THE BUG: method calling ClassName.method causes stack overflow."""
 
         class TestClass:
@@ -68,16 +61,17 @@ class TestDeprecatedImplementationBugs:
         # 3. original_method calls TestClass.test_method(self, value)
         # 4. TestClass.test_method is now the wrapper (from step 1)
         # 5. Infinite recursion: wrapper -> original -> class.method (wrapper) -> ...
+        # Runs on the pytest-asyncio loop rather than paying for a fresh
+        # asyncio.run() loop per test
         with pytest.raises(RecursionError):
-            import asyncio
-
-            asyncio.run(instance.test_method(5))
+            await instance.test_method(5)
 
     def test_sync_method_calling_via_class_causes_recursion(self, monkeypatch):
         """REPRODUCES THE BUG: sync method calling via class causes stack overflow."""
         # Disable error reporting for this test to avoid complications with traceback during recursion
 
         monkeypatch.setenv("DISABLE_CDP_ERROR_REPORTING", "true")
+        _refresh_flags()
 
         class TestClass:
             def test_method(self, value: int) -> int:
@@ -91,48 +85,20 @@ class TestDeprecatedImplementationBugs:
             instance.test_method(4)
 
 
-class TestDoubleWrappingBehavior:
-    """Tests for double-wrapping behavior."""
-
-    @pytest.mark.asyncio
-    async def test_double_wrapping_classes(self):
-        """Should allow double-wrapping - creates deeper wrapper chains."""
-
-        class TestClass:
-            async def test_method(self, value: int) -> int:
-                return value * 2
-
-        # Wrap multiple times
-        wrap_class_with_error_tracking_deprecated(TestClass)
-        wrap_class_with_error_tracking_deprecated(TestClass)
-        wrap_class_with_error_tracking_deprecated(TestClass)
-
-        instance = TestClass()
-        result = await instance.test_method(5)
-        assert result == 10
-
-    @pytest.mark.asyncio
-    async def test_rapid_successive_wraps(self):
-        """Should handle rapid successive wraps."""
-
-        class TestClass:
-            async def test_method(self) -> str:
-                return "test"
-
-        # Rapid successive wraps
-        for _ in range(10):
-            wrap_class_with_error_tracking_deprecated(TestClass)
-
-        instance = TestClass()
-        result = await instance.test_method()
-        assert result == "test"
-
+@pytest.mark.parametrize(
+    "wrap",
+    [wrap_class_with_error_tracking, wrap_class_with_error_tracking_deprecated],
+    ids=["current", "deprecated"],
+)
+class TestSharedWrappingBehavior:
+    """Behavior common to both wrapper implementations.
 
-class TestNormalOperation:
-    """Tests for normal operation without edge cases."""
+    Parametrized over the current and deprecated wrappers so each case is
+    written (and its fixtures evaluated) once instead of per implementation.
+    """
 
     @pytest.mark.asyncio
-    async def test_wrap_normal_async_methods(self):
+    async def test_wrap_normal_async_methods(self, wrap):
         """Should wrap normal async methods without issues."""
 
         class TestClass:
@@ -142,7 +108,7 @@ class TestNormalOperation:
             async def another_method(self, value: str) -> str:
                 return f"Hello {value}"
 
-        wrap_class_with_error_tracking_deprecated(TestClass)
+        wrap(TestClass)
         instance = TestClass()
 
         result1 = await instance.test_method(5)
@@ -151,7 +117,7 @@ class TestNormalOperation:
         result2 = await instance.another_method("World")
         assert result2 == "Hello World"
 
-    def test_wrap_normal_sync_methods(self):
+    def test_wrap_normal_sync_methods(self, wrap):
         """Should wrap normal sync methods without issues."""
 
         class TestClass:
@@ -161,7 +127,7 @@ class TestNormalOperation:
             def another_method(self, value: str) -> str:
                 return f"Hello {value}"
 
-        wrap_class_with_error_tracking_deprecated(TestClass)
+        wrap(TestClass)
         instance = TestClass()
 
         result1 = instance.test_method(5)
@@ -171,13 +137,12 @@ class TestNormalOperation:
         assert result2 == "Hello World"
 
     @pytest.mark.asyncio
-    async def test_track_errors_correctly(self, monkeypatch):
+    async def test_track_errors_correctly(self, wrap, monkeypatch):
         """Should track errors correctly in wrapped methods."""
-        send_event_called = False
+        sent_events = []
 
         async def mock_send_event(event):
-            nonlocal send_event_called
-            send_event_called = True
+            sent_events.append(event)
 
         monkeypatch.setattr("cdp.analytics.send_event", mock_send_event)
 
@@ -185,14 +150,16 @@ class TestNormalOperation:
             async def failing_method(self):
                 raise NetworkError("network_connection_failed", "Test network error", {})
 
-        wrap_class_with_error_tracking_deprecated(TestClass)
+        wrap(TestClass)
         instance = TestClass()
 
         with pytest.raises(NetworkError):
             await instance.failing_method()
 
+        assert sent_events
+
     @pytest.mark.asyncio
-    async def test_preserve_method_context(self):
+    async def test_preserve_method_context(self, wrap):
         """Should preserve method context correctly."""
 
         class TestClass:
@@ -202,12 +169,50 @@ class TestNormalOperation:
             async def get_value(self) -> int:
                 return self.value
 
-        wrap_class_with_error_tracking_deprecated(TestClass)
+        wrap(TestClass)
         instance = TestClass()
 
         result = await instance.get_value()
         assert result == 42
 
+    @pytest.mark.asyncio
+    async def test_double_wrapping(self, wrap):
+        """Should allow double-wrapping - creates deeper wrapper chains."""
+
+        class TestClass:
+            async def test_method(self, value: int) -> int:
+                return value * 2
+
+        # Wrap multiple times
+        wrap(TestClass)
+        wrap(TestClass)
+        wrap(TestClass)
+
+        instance = TestClass()
+        result = await instance.test_method(5)
+        assert result == 10
+
+
+class TestDoubleWrappingBehavior:
+    """Tests for double-wrapping behavior."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("wrap_count", [1, 3, 10])
+    async def test_rapid_successive_wraps(self, wrap_count):
+        """Should handle rapid successive wraps."""
+
+        class TestClass:
+            async def test_method(self) -> str:
+                return "test"
+
+        # Rapid successive wraps
+        for _ in range(wrap_count):
+            wrap_class_with_error_tracking_deprecated(TestClass)
+
+        instance = TestClass()
+        result = await instance.test_method()
+        assert result == "test"
+
 
 class TestNewImplementation:
     """Tests for the fixed implementation."""
@@ -246,81 +251,6 @@ class TestNewImplementation:
         result = instance.test_method(4)
         assert result == 4  # Returns first arg when recursive call is detected
 
-    @pytest.mark.asyncio
-    async def test_wrap_normal_methods(self):
-        """Should wrap normal methods without issues."""
-
-        class TestClass:
-            async def test_method(self, value: int) -> int:
-                return value * 2
-
-            async def another_method(self, value: str) -> str:
-                return f"Hello {value}"
-
-        wrap_class_with_error_tracking(TestClass)
-        instance = TestClass()
-
-        result1 = await instance.test_method(5)
-        assert result1 == 10
-
-        result2 = await instance.another_method("World")
-        assert result2 == "Hello World"
-
-    @pytest.mark.asyncio
-    async def test_track_errors_correctly(self, monkeypatch):
-        """Should track errors correctly in wrapped methods."""
-        send_event_called = False
-
-        async def mock_send_event(event):
-            nonlocal send_event_called
-            send_event_called = True
-
-        monkeypatch.setattr("cdp.analytics.send_event", mock_send_event)
-
-        class TestClass:
-            async def failing_method(self):
-                raise NetworkError("network_connection_failed", "Test network error", {})
-
-        wrap_class_with_error_tracking(TestClass)
-        instance = TestClass()
-
-        with pytest.raises(NetworkError):
-            await instance.failing_method()
-
-    @pytest.mark.asyncio
-    async def test_preserve_method_context(self):
-        """Should preserve method context correctly."""
-
-        class TestClass:
-            def __init__(self):
-                self.value = 42
-
-            async def get_value(self) -> int:
-                return self.value
-
-        wrap_class_with_error_tracking(TestClass)
-        instance = TestClass()
-
-        result = await instance.get_value()
-        assert result == 42
-
-    @pytest.mark.asyncio
-    async def test_double_wrapping_still_works(self):
-        """Should handle double-wrapping correctly."""
-
-        class TestClass:
-            async def test_method(self, value: int) -> int:
-                return value * 2
-
-        # Wrap multiple times - should still work correctly
-        wrap_class_with_error_tracking(TestClass)
-        wrap_class_with_error_tracking(TestClass)
-        wrap_class_with_error_tracking(TestClass)
-
-        instance = TestClass()
-        result = await instance.test_method(5)
-        assert result == 10
-
     @pytest.mark.asyncio
     async def test_method_calling_class_with_different_logic(self):
         """Should handle methods that call via class but with different logic."""
@@ -0,0 +1,74 @@
+from unittest.mock import patch
+
+import pytest
+
+from cdp.cache import AsyncTTLCache
+
+
+@pytest.mark.asyncio
+async def test_get_returns_none_for_missing_key():
+    """Test that a missing key returns None."""
+    cache = AsyncTTLCache()
+    assert await cache.get("missing") is None
+
+
+@pytest.mark.asyncio
+async def test_set_and_get_roundtrip():
+    """Test that a stored value is returned before its TTL elapses."""
+    cache = AsyncTTLCache(ttl=60.0)
+    await cache.set("key", "value")
+    assert await cache.get("key") == "value"
+
+
+@pytest.mark.asyncio
+async def test_entry_expires_after_ttl():
+    """Test that an entry is dropped once its TTL elapses."""
+    cache = AsyncTTLCache(ttl=5.0)
+
+    with patch("cdp.cache.time.monotonic", return_value=100.0):
+        await cache.set("key", "value")
+
+    with patch("cdp.cache.time.monotonic", return_value=104.9):
+        assert await cache.get("key") == "value"
+
+    with patch("cdp.cache.time.monotonic", return_value=105.1):
+        assert await cache.get("key") is None
+
+
+@pytest.mark.asyncio
+async def test_infinite_ttl_never_expires():
+    """Test that an entry stored with an infinite TTL is always returned."""
+    cache = AsyncTTLCache(ttl=5.0)
+
+    with patch("cdp.cache.time.monotonic", return_value=100.0):
+        await cache.set("key", "value", ttl=float("inf"))
+
+    with patch("cdp.cache.time.monotonic", return_value=1e9):
+        assert await cache.get("key") == "value"
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_entry_is_evicted():
+    """Test that the least recently used entry is evicted at capacity."""
+    cache = AsyncTTLCache(maxsize=2, ttl=60.0)
+    await cache.set("a", 1)
+    await cache.set("b", 2)
+
+    # Touch "a" so "b" becomes the least recently used entry
+    assert await cache.get("a") == 1
+
+    await cache.set("c", 3)
+    assert await cache.get("b") is None
+    assert await cache.get("a") == 1
+    assert await cache.get("c") == 3
+
+
+@pytest.mark.asyncio
+async def test_clear_drops_all_entries():
+    """Test that clear removes every entry."""
+    cache = AsyncTTLCache(ttl=60.0)
+    await cache.set("a", 1)
+    await cache.set("b", 2)
+    await cache.clear()
+    assert await cache.get("a") is None
+    assert await cache.get("b") is None
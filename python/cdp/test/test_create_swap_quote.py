@@ -1,5 +1,6 @@
 """Tests for create_swap_quote functionality."""
 
+import functools
 import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -11,50 +12,87 @@ from cdp.actions.evm.swap.create_swap_quote import (
 from cdp.actions.evm.swap.types import Permit2Data, QuoteSwapResult, SwapUnavailableResult
 
 
+@functools.lru_cache(maxsize=128)
+def _build_mock_swap_response(
+    to_amount,
+    min_to_amount,
+    tx_to,
+    tx_data,
+    tx_value,
+    tx_gas,
+    tx_gas_price,
+    tx_max_fee_per_gas,
+    tx_max_priority_fee_per_gas,
+    permit2_eip712_json,
+    permit2_hash,
+) -> MagicMock:
+    """Build the mock response for one combination of payload fields.
+
+    Memoized: the same payloads are replayed across many tests and MagicMock
+    construction is comparatively slow, so identical responses are built once.
+    """
+    if permit2_eip712_json is not None:
+        permit2 = MagicMock(eip712=json.loads(permit2_eip712_json), hash=permit2_hash)
+    else:
+        permit2 = None
+    # Single constructor call per mock: MagicMock(**attrs) configures children
+    # in one pass instead of going through __setattr__ per field
+    return MagicMock(
+        to_amount=to_amount,
+        min_to_amount=min_to_amount,
+        transaction=MagicMock(
+            to=tx_to,
+            data=tx_data,
+            value=tx_value,
+            gas=tx_gas,
+            gas_price=tx_gas_price,
+            max_fee_per_gas=tx_max_fee_per_gas,
+            max_priority_fee_per_gas=tx_max_priority_fee_per_gas,
+        ),
+        permit2=permit2,
+    )
+
+
 def create_mock_swap_response(response_data: dict) -> MagicMock:
     """Create a mock CreateSwapQuoteResponse object from response data.
 
     This bypasses the buggy Pydantic validation in the generated code.
     """
-    mock = MagicMock()
-    mock.to_amount = response_data.get("toAmount")
-    mock.min_to_amount = response_data.get("minToAmount")
-
-    # Mock transaction
     tx_data = response_data.get("transaction", {})
-    mock.transaction = MagicMock()
-    mock.transaction.to = tx_data.get("to")
-    mock.transaction.data = tx_data.get("data")
-    mock.transaction.value = tx_data.get("value")
-    mock.transaction.gas = tx_data.get("gas")
-    mock.transaction.gas_price = tx_data.get("gasPrice")
-    mock.transaction.max_fee_per_gas = tx_data.get("maxFeePerGas")
-    mock.transaction.max_priority_fee_per_gas = tx_data.get("maxPriorityFeePerGas")
-
-    # Mock permit2
     permit2_data = response_data.get("permit2")
-    if permit2_data and permit2_data.get("eip712"):
-        mock.permit2 = MagicMock()
-        mock.permit2.eip712 = permit2_data.get("eip712")
-        mock.permit2.hash = permit2_data.get("hash")
-    else:
-        mock.permit2 = None
-
-    return mock
+    has_permit2 = bool(permit2_data and permit2_data.get("eip712"))
+    return _build_mock_swap_response(
+        response_data.get("toAmount"),
+        response_data.get("minToAmount"),
+        tx_data.get("to"),
+        tx_data.get("data"),
+        tx_data.get("value"),
+        tx_data.get("gas"),
+        tx_data.get("gasPrice"),
+        tx_data.get("maxFeePerGas"),
+        tx_data.get("maxPriorityFeePerGas"),
+        json.dumps(permit2_data["eip712"], sort_keys=True) if has_permit2 else None,
+        permit2_data.get("hash") if has_permit2 else None,
+    )
+
+
+@pytest.fixture(autouse=True, scope="module")
+def patch_from_dict():
+    """Patch CreateSwapQuoteResponse.from_dict to bypass buggy Pydantic validation.
+
+    Module-scoped: the patch target and side effect are test-independent, so
+    one enter/exit covers the whole module.
+    """
+    with patch(
+        "cdp.openapi_client.models.create_swap_quote_response.CreateSwapQuoteResponse.from_dict",
+        side_effect=create_mock_swap_response,
+    ):
+        yield
 
 
 class TestCreateSwapQuote:
     """Test create_swap_quote function."""
 
-    @pytest.fixture(autouse=True)
-    def patch_from_dict(self):
-        """Patch CreateSwapQuoteResponse.from_dict to bypass buggy Pydantic validation."""
-        with patch(
-            "cdp.openapi_client.models.create_swap_quote_response.CreateSwapQuoteResponse.from_dict",
-            side_effect=lambda obj: create_mock_swap_response(obj),
-        ):
-            yield
-
     @pytest.fixture
     def mock_api_clients(self):
         """Create mock API clients."""
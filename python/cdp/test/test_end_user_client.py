@@ -1,6 +1,7 @@
 """Tests for End User Client functionality."""
 
-from unittest.mock import AsyncMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
 
 import pytest
 
@@ -16,6 +17,30 @@ from cdp.openapi_client.models.create_end_user_request_solana_account import (
 )
 from cdp.openapi_client.models.email_authentication import EmailAuthentication
 
+# Built once: pydantic validation is not free and these tests never mutate it
+_AUTH_METHOD = AuthenticationMethod(EmailAuthentication(type="email", email="test@example.com"))
+
+
+@pytest.fixture(scope="module")
+def mock_api_clients():
+    """Build the mock ApiClients once per module; AsyncMock construction is expensive."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def end_user_client(mock_api_clients):
+    """Return an EndUserClient over the shared mock, reset between tests."""
+    mock_api_clients.end_user.reset_mock(return_value=True, side_effect=True)
+    return EndUserClient(api_clients=mock_api_clients)
+
+
+@pytest.fixture(scope="module")
+def single_user_response(end_user_model_factory, list_end_users_response_factory):
+    """One-user listing page shared by the pagination and sort tests."""
+    return list_end_users_response_factory(
+        end_users=[end_user_model_factory(user_id="user1")], next_page_token=None
+    )
+
 
 def test_init():
     """Test the initialization of the EndUserClient."""
@@ -36,41 +61,41 @@ def test_init():
 
 
 @pytest.mark.asyncio
-async def test_validate_access_token_success(end_user_model_factory):
+async def test_validate_access_token_success(
+    end_user_client, mock_api_clients, end_user_model_factory
+):
     """Test successful access token validation."""
     mock_access_token = "aaa.bbb.ccc"
     mock_end_user_id = "1234567890"
     mock_end_user_model = end_user_model_factory(user_id=mock_end_user_id)
-    mock_api_clients = AsyncMock()
     mock_api_clients.end_user.validate_end_user_access_token = AsyncMock(
         return_value=mock_end_user_model
     )
 
-    client = EndUserClient(api_clients=mock_api_clients)
-
-    end_user = await client.validate_access_token(access_token=mock_access_token)
+    end_user = await end_user_client.validate_access_token(access_token=mock_access_token)
     assert end_user.user_id == mock_end_user_id
 
 
 @pytest.mark.asyncio
-async def test_validate_access_token_missing_access_token(end_user_model_factory):
+async def test_validate_access_token_missing_access_token(
+    end_user_client, mock_api_clients, end_user_model_factory
+):
     """Test missing access token."""
     mock_access_token = None
     mock_end_user_id = "1234567890"
     mock_end_user_model = end_user_model_factory(user_id=mock_end_user_id)
-    mock_api_clients = AsyncMock()
     mock_api_clients.end_user.validate_end_user_access_token = AsyncMock(
         return_value=mock_end_user_model
     )
 
-    client = EndUserClient(api_clients=mock_api_clients)
-
     with pytest.raises(ValueError, match="Input should be a valid string"):
-        await client.validate_access_token(access_token=mock_access_token)
+        await end_user_client.validate_access_token(access_token=mock_access_token)
 
 
 @pytest.mark.asyncio
-async def test_list_end_users_success(end_user_model_factory, list_end_users_response_factory):
+async def test_list_end_users_success(
+    end_user_client, mock_api_clients, end_user_model_factory, list_end_users_response_factory
+):
     """Test successful end users listing."""
     mock_end_user_1 = end_user_model_factory(user_id="user1")
     mock_end_user_2 = end_user_model_factory(user_id="user2")
@@ -78,12 +103,9 @@ async def test_list_end_users_success(end_user_model_factory, list_end_users_res
         end_users=[mock_end_user_1, mock_end_user_2], next_page_token="next_page_token"
     )
 
-    mock_api_clients = AsyncMock()
     mock_api_clients.end_user.list_end_users = AsyncMock(return_value=mock_response)
 
-    client = EndUserClient(api_clients=mock_api_clients)
-
-    result = await client.list_end_users()
+    result = await end_user_client.list_end_users()
 
     assert len(result.end_users) == 2
     assert result.end_users[0].user_id == "user1"
@@ -93,18 +115,12 @@ async def test_list_end_users_success(end_user_model_factory, list_end_users_res
 
 @pytest.mark.asyncio
 async def test_list_end_users_with_pagination(
-    end_user_model_factory, list_end_users_response_factory
+    end_user_client, mock_api_clients, single_user_response
 ):
     """Test end users listing with pagination parameters."""
-    mock_end_user = end_user_model_factory(user_id="user1")
-    mock_response = list_end_users_response_factory(end_users=[mock_end_user], next_page_token=None)
+    mock_api_clients.end_user.list_end_users = AsyncMock(return_value=single_user_response)
 
-    mock_api_clients = AsyncMock()
-    mock_api_clients.end_user.list_end_users = AsyncMock(return_value=mock_response)
-
-    client = EndUserClient(api_clients=mock_api_clients)
-
-    result = await client.list_end_users(page_size=10, page_token="token123")
+    result = await end_user_client.list_end_users(page_size=10, page_token="token123")
 
     assert len(result.end_users) == 1
     assert result.end_users[0].user_id == "user1"
@@ -117,17 +133,11 @@ async def test_list_end_users_with_pagination(
 
 
 @pytest.mark.asyncio
-async def test_list_end_users_with_sort(end_user_model_factory, list_end_users_response_factory):
+async def test_list_end_users_with_sort(end_user_client, mock_api_clients, single_user_response):
     """Test end users listing with sort parameter."""
-    mock_end_user = end_user_model_factory(user_id="user1")
-    mock_response = list_end_users_response_factory(end_users=[mock_end_user], next_page_token=None)
-
-    mock_api_clients = AsyncMock()
-    mock_api_clients.end_user.list_end_users = AsyncMock(return_value=mock_response)
+    mock_api_clients.end_user.list_end_users = AsyncMock(return_value=single_user_response)
 
-    client = EndUserClient(api_clients=mock_api_clients)
-
-    result = await client.list_end_users(sort=["createdAt=desc"])
+    result = await end_user_client.list_end_users(sort=["createdAt=desc"])
 
     assert len(result.end_users) == 1
     assert result.end_users[0].user_id == "user1"
@@ -139,17 +149,42 @@ async def test_list_end_users_with_sort(end_user_model_factory, list_end_users_r
 
 
 @pytest.mark.asyncio
-async def test_create_end_user_with_provided_user_id(end_user_model_factory):
+async def test_iter_end_users_follows_pagination(
+    end_user_client, mock_api_clients, end_user_model_factory, list_end_users_response_factory
+):
+    """Test that iter_end_users yields users across pages."""
+    page_one = list_end_users_response_factory(
+        end_users=[
+            end_user_model_factory(user_id="user1"),
+            end_user_model_factory(user_id="user2"),
+        ],
+        next_page_token="page2",
+    )
+    page_two = list_end_users_response_factory(
+        end_users=[end_user_model_factory(user_id="user3")], next_page_token=None
+    )
+
+    mock_api_clients.end_user.list_end_users = AsyncMock(side_effect=[page_one, page_two])
+
+    user_ids = [end_user.user_id async for end_user in end_user_client.iter_end_users(page_size=2)]
+
+    assert user_ids == ["user1", "user2", "user3"]
+    assert mock_api_clients.end_user.list_end_users.call_count == 2
+    second_call = mock_api_clients.end_user.list_end_users.call_args_list[1]
+    assert second_call.kwargs["page_token"] == "page2"
+
+
+@pytest.mark.asyncio
+async def test_create_end_user_with_provided_user_id(
+    end_user_client, mock_api_clients, end_user_model_factory
+):
     """Test creating an end user with a provided user_id."""
     mock_user_id = "custom-user-id"
     mock_end_user_model = end_user_model_factory(user_id=mock_user_id)
-    mock_api_clients = AsyncMock()
     mock_api_clients.end_user.create_end_user = AsyncMock(return_value=mock_end_user_model)
 
-    client = EndUserClient(api_clients=mock_api_clients)
-
-    auth_method = AuthenticationMethod(EmailAuthentication(type="email", email="test@example.com"))
-    end_user = await client.create_end_user(
+    auth_method = _AUTH_METHOD
+    end_user = await end_user_client.create_end_user(
         authentication_methods=[auth_method],
         user_id=mock_user_id,
     )
@@ -162,47 +197,49 @@ async def test_create_end_user_with_provided_user_id(end_user_model_factory):
 
 
 @pytest.mark.asyncio
-async def test_create_end_user_generates_uuid_if_not_provided(end_user_model_factory):
+async def test_create_end_user_generates_uuid_if_not_provided(
+    end_user_client, mock_api_clients, end_user_model_factory, monkeypatch
+):
     """Test that a UUID is generated if user_id is not provided."""
     generated_uuid = "generated-uuid-1234"
     mock_end_user_model = end_user_model_factory(user_id=generated_uuid)
-    mock_api_clients = AsyncMock()
     mock_api_clients.end_user.create_end_user = AsyncMock(return_value=mock_end_user_model)
 
-    client = EndUserClient(api_clients=mock_api_clients)
+    auth_method = _AUTH_METHOD
 
-    auth_method = AuthenticationMethod(EmailAuthentication(type="email", email="test@example.com"))
-
-    with patch("cdp.end_user_client.uuid.uuid4") as mock_uuid:
-        mock_uuid.return_value = generated_uuid
-        await client.create_end_user(
-            authentication_methods=[auth_method],
-        )
+    uuid_calls = []
+    monkeypatch.setattr(
+        "cdp.end_user_client.uuid.uuid4",
+        lambda: uuid_calls.append(1) or SimpleNamespace(hex=generated_uuid),
+    )
+    await end_user_client.create_end_user(
+        authentication_methods=[auth_method],
+    )
 
-    mock_uuid.assert_called_once()
+    assert len(uuid_calls) == 1
     call_args = mock_api_clients.end_user.create_end_user.call_args
     request = call_args.kwargs["create_end_user_request"]
     assert request.user_id == generated_uuid
 
 
 @pytest.mark.asyncio
-async def test_create_end_user_with_evm_account(end_user_model_factory):
+async def test_create_end_user_with_evm_account(
+    end_user_client, mock_api_clients, end_user_model_factory, monkeypatch
+):
     """Test creating an end user with an EVM account option."""
     mock_end_user_model = end_user_model_factory(user_id="test-user")
-    mock_api_clients = AsyncMock()
     mock_api_clients.end_user.create_end_user = AsyncMock(return_value=mock_end_user_model)
 
-    client = EndUserClient(api_clients=mock_api_clients)
-
-    auth_method = AuthenticationMethod(EmailAuthentication(type="email", email="test@example.com"))
+    auth_method = _AUTH_METHOD
     evm_account = CreateEndUserRequestEvmAccount(create_smart_account=True)
 
-    with patch("cdp.end_user_client.uuid.uuid4") as mock_uuid:
-        mock_uuid.return_value = "generated-uuid"
-        await client.create_end_user(
-            authentication_methods=[auth_method],
-            evm_account=evm_account,
-        )
+    monkeypatch.setattr(
+        "cdp.end_user_client.uuid.uuid4", lambda: SimpleNamespace(hex="generated-uuid")
+    )
+    await end_user_client.create_end_user(
+        authentication_methods=[auth_method],
+        evm_account=evm_account,
+    )
 
     call_args = mock_api_clients.end_user.create_end_user.call_args
     request = call_args.kwargs["create_end_user_request"]
@@ -211,23 +248,23 @@ async def test_create_end_user_with_evm_account(end_user_model_factory):
 
 
 @pytest.mark.asyncio
-async def test_create_end_user_with_solana_account(end_user_model_factory):
+async def test_create_end_user_with_solana_account(
+    end_user_client, mock_api_clients, end_user_model_factory, monkeypatch
+):
     """Test creating an end user with a Solana account option."""
     mock_end_user_model = end_user_model_factory(user_id="test-user")
-    mock_api_clients = AsyncMock()
     mock_api_clients.end_user.create_end_user = AsyncMock(return_value=mock_end_user_model)
 
-    client = EndUserClient(api_clients=mock_api_clients)
-
-    auth_method = AuthenticationMethod(EmailAuthentication(type="email", email="test@example.com"))
+    auth_method = _AUTH_METHOD
     solana_account = CreateEndUserRequestSolanaAccount(create_smart_account=False)
 
-    with patch("cdp.end_user_client.uuid.uuid4") as mock_uuid:
-        mock_uuid.return_value = "generated-uuid"
-        await client.create_end_user(
-            authentication_methods=[auth_method],
-            solana_account=solana_account,
-        )
+    monkeypatch.setattr(
+        "cdp.end_user_client.uuid.uuid4", lambda: SimpleNamespace(hex="generated-uuid")
+    )
+    await end_user_client.create_end_user(
+        authentication_methods=[auth_method],
+        solana_account=solana_account,
+    )
 
     call_args = mock_api_clients.end_user.create_end_user.call_args
     request = call_args.kwargs["create_end_user_request"]
@@ -236,19 +273,61 @@ async def test_create_end_user_with_solana_account(end_user_model_factory):
 
 
 @pytest.mark.asyncio
-async def test_create_end_user_handles_error():
+async def test_create_end_users_bulk(end_user_client, mock_api_clients, end_user_model_factory):
+    """Test creating multiple end users concurrently."""
+    mock_api_clients.end_user.create_end_user = AsyncMock(
+        side_effect=lambda create_end_user_request: end_user_model_factory(
+            user_id=create_end_user_request.user_id
+        )
+    )
+
+    auth_method = _AUTH_METHOD
+    specs = [{"authentication_methods": [auth_method], "user_id": f"user-{i}"} for i in range(5)]
+
+    results = await end_user_client.create_end_users_bulk(specs)
+
+    assert [end_user.user_id for end_user in results] == [f"user-{i}" for i in range(5)]
+    assert mock_api_clients.end_user.create_end_user.call_count == 5
+
+
+@pytest.mark.asyncio
+async def test_create_end_users_bulk_returns_exceptions_in_place(
+    end_user_client, mock_api_clients, end_user_model_factory
+):
+    """Test that a failed create surfaces as an exception in its slot."""
+    expected_error = Exception("API Error: Invalid authentication method")
+
+    def _create(create_end_user_request):
+        if create_end_user_request.user_id == "bad-user":
+            raise expected_error
+        return end_user_model_factory(user_id=create_end_user_request.user_id)
+
+    mock_api_clients.end_user.create_end_user = AsyncMock(side_effect=_create)
+
+    auth_method = _AUTH_METHOD
+    specs = [
+        {"authentication_methods": [auth_method], "user_id": "good-user"},
+        {"authentication_methods": [auth_method], "user_id": "bad-user"},
+    ]
+
+    results = await end_user_client.create_end_users_bulk(specs)
+
+    assert results[0].user_id == "good-user"
+    assert results[1] is expected_error
+
+
+@pytest.mark.asyncio
+async def test_create_end_user_handles_error(end_user_client, mock_api_clients, monkeypatch):
     """Test that errors are propagated when creating an end user."""
-    mock_api_clients = AsyncMock()
     expected_error = Exception("API Error: Invalid authentication method")
     mock_api_clients.end_user.create_end_user = AsyncMock(side_effect=expected_error)
 
-    client = EndUserClient(api_clients=mock_api_clients)
-
-    auth_method = AuthenticationMethod(EmailAuthentication(type="email", email="test@example.com"))
+    auth_method = _AUTH_METHOD
 
-    with patch("cdp.end_user_client.uuid.uuid4") as mock_uuid:
-        mock_uuid.return_value = "generated-uuid"
-        with pytest.raises(Exception, match="API Error: Invalid authentication method"):
-            await client.create_end_user(
-                authentication_methods=[auth_method],
-            )
+    monkeypatch.setattr(
+        "cdp.end_user_client.uuid.uuid4", lambda: SimpleNamespace(hex="generated-uuid")
+    )
+    with pytest.raises(Exception, match="API Error: Invalid authentication method"):
+        await end_user_client.create_end_user(
+            authentication_methods=[auth_method],
+        )
@@ -1,207 +1,351 @@
 """Tests for EVM client swap functionality."""
 
+import functools
 import json
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from cdp.actions.evm.swap.types import QuoteSwapResult, SwapUnavailableResult
-from cdp.api_clients import ApiClients
 from cdp.evm_client import EvmClient
 
+try:  # orjson is optional; fall back to stdlib json when it is not installed
+    from orjson import dumps as _dumps_bytes
+except ImportError:
+
+    def _dumps_bytes(obj):
+        return json.dumps(obj).encode()
+
+
+_PERMIT2_MOCK_HASH = "0x" + "a" * 64  # 32 bytes = 64 hex chars
+_INSUFFICIENT_LIQUIDITY_BYTES = b'{"liquidityAvailable": false}'
+
+# Canonical response payloads, encoded once per session by the fixtures below
+# instead of dict-built and json.dumps'd inside every test.
+
+# Sub-dicts shared verbatim across payloads. They are only ever passed to
+# json encoding (read-only), so aliasing one dict across payloads is safe.
+_STD_FEES = {
+    "gasFee": {
+        "amount": "1000000000000000",
+        "token": "0x0000000000000000000000000000000000000000",
+    },
+    "protocolFee": {
+        "amount": "0",
+        "token": "0x0000000000000000000000000000000000000000",
+    },
+}
+_STD_ISSUES = {
+    "allowance": {
+        "currentAllowance": "0",
+        "spender": "0x0000000000000000000000000000000000000000",
+    },
+    "balance": {
+        "token": "0x0000000000000000000000000000000000000000",
+        "currentBalance": "0",
+        "requiredBalance": "0",
+    },
+    "simulationIncomplete": False,
+}
+_STD_TX = {
+    "to": "0x1234567890123456789012345678901234567890",
+    "data": "0xabcdef",
+    "value": "0",
+    "gas": "200000",
+    "gasPrice": "50000000000",
+}
+
+_ETH_USDC_PRICE_PAYLOAD = {
+    "liquidityAvailable": True,
+    "toAmount": "2000000000",  # Changed from buyAmount
+    "fromAmount": "1000000000000000000",  # Changed from sellAmount
+    "toToken": "0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913",  # Changed from buyToken
+    "fromToken": "0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE",  # Changed from sellToken
+    "minToAmount": "1980000000",  # Changed from minBuyAmount
+    "blockNumber": "123456",
+    "gasPrice": "50000000000",
+    "gas": "200000",
+    "fees": _STD_FEES,
+    "issues": _STD_ISSUES,
+}
+
+_USDC_ETH_PRICE_PAYLOAD = {
+    "liquidityAvailable": True,
+    "toAmount": "500000000000000000",  # 0.5 ETH
+    "fromAmount": "1000000000",  # 1000 USDC
+    "toToken": "0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE",
+    "fromToken": "0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913",
+    "minToAmount": "495000000000000000",
+    "blockNumber": "123457",
+    "gasPrice": "50000000000",
+    "gas": "200000",
+    "fees": _STD_FEES,
+    "issues": _STD_ISSUES,
+}
+
+_ETH_USDC_QUOTE_PAYLOAD = {
+    "liquidityAvailable": True,
+    "toAmount": "2000000000",  # 2000 USDC
+    "fromAmount": "1000000000000000000",  # 1 ETH
+    "toToken": "0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913",
+    "fromToken": "0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE",
+    "minToAmount": "1980000000",
+    "blockNumber": "123456",
+    "fees": _STD_FEES,
+    "issues": _STD_ISSUES,
+    "transaction": {**_STD_TX, "value": "1000000000000000000"},
+    "permit2": None,  # No permit2 needed for native ETH swaps
+}
+
+_USDC_WETH_PERMIT2_QUOTE_PAYLOAD = {
+    "liquidityAvailable": True,
+    "toAmount": "500000000000000000",  # 0.5 WETH
+    "fromAmount": "1000000000",  # 1000 USDC
+    "toToken": "0x4200000000000000000000000000000000000006",
+    "fromToken": "0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913",
+    "minToAmount": "495000000000000000",
+    "blockNumber": "123457",
+    "fees": _STD_FEES,
+    "issues": _STD_ISSUES,
+    "transaction": _STD_TX,
+    "permit2": {
+        "eip712": {
+            "domain": {
+                "name": "Permit2",
+                "chainId": 8453,
+                "verifyingContract": "0xB952578f3520EE8Ea45b7914994dcf4702cEe578",
+            },
+            "types": {"PermitTransferFrom": []},
+            "primaryType": "PermitTransferFrom",
+            "message": {},
+        },
+        "hash": _PERMIT2_MOCK_HASH,
+    },
+}
+
+_CUSTOM_SLIPPAGE_QUOTE_PAYLOAD = {
+    "liquidityAvailable": True,
+    "toAmount": "2000000000",  # 2000 USDC
+    "fromAmount": "1000000000000000000",  # 1 ETH
+    "toToken": "0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913",
+    "fromToken": "0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE",
+    "minToAmount": "1950000000",  # 2.5% slippage
+    "blockNumber": "123458",
+    "fees": _STD_FEES,
+    "issues": _STD_ISSUES,
+    "transaction": _STD_TX,
+    "permit2": None,  # No permit2 for this test
+}
+
+
+@pytest.fixture(scope="session")
+def eth_usdc_price_bytes():
+    """ETH to USDC price response, encoded once per session."""
+    return _dumps_bytes(_ETH_USDC_PRICE_PAYLOAD)
+
+
+@pytest.fixture(scope="session")
+def usdc_eth_price_bytes():
+    """USDC to ETH price response, encoded once per session."""
+    return _dumps_bytes(_USDC_ETH_PRICE_PAYLOAD)
+
+
+@pytest.fixture(scope="session")
+def eth_usdc_quote_bytes():
+    """ETH to USDC quote response, encoded once per session."""
+    return _dumps_bytes(_ETH_USDC_QUOTE_PAYLOAD)
+
+
+@pytest.fixture(scope="session")
+def usdc_weth_permit2_quote_bytes():
+    """USDC to WETH quote response requiring Permit2, encoded once per session."""
+    return _dumps_bytes(_USDC_WETH_PERMIT2_QUOTE_PAYLOAD)
+
+
+@pytest.fixture(scope="session")
+def custom_slippage_quote_bytes():
+    """Quote response for the custom-slippage case, encoded once per session."""
+    return _dumps_bytes(_CUSTOM_SLIPPAGE_QUOTE_PAYLOAD)
+
+
+class _BytesResp:
+    """Minimal response stub exposing ``read()``; much cheaper than AsyncMock."""
+
+    __slots__ = ("_b",)
+
+    def __init__(self, b):
+        self._b = b
+
+    async def read(self):
+        return self._b
+
+
+@functools.lru_cache(maxsize=128)
+def _build_mock_swap_response(
+    to_amount,
+    min_to_amount,
+    tx_to,
+    tx_data,
+    tx_value,
+    tx_gas,
+    tx_gas_price,
+    tx_max_fee_per_gas,
+    tx_max_priority_fee_per_gas,
+    permit2_eip712_json,
+    permit2_hash,
+) -> MagicMock:
+    """Build the mock response for one combination of payload fields.
+
+    Memoized: the same payloads are replayed across many tests and MagicMock
+    construction is comparatively slow, so identical responses are built once.
+    """
+    if permit2_eip712_json is not None:
+        permit2 = MagicMock(eip712=json.loads(permit2_eip712_json), hash=permit2_hash)
+    else:
+        permit2 = None
+    # Single constructor call per mock: MagicMock(**attrs) configures children
+    # in one pass instead of going through __setattr__ per field
+    return MagicMock(
+        to_amount=to_amount,
+        min_to_amount=min_to_amount,
+        transaction=MagicMock(
+            to=tx_to,
+            data=tx_data,
+            value=tx_value,
+            gas=tx_gas,
+            gas_price=tx_gas_price,
+            max_fee_per_gas=tx_max_fee_per_gas,
+            max_priority_fee_per_gas=tx_max_priority_fee_per_gas,
+        ),
+        permit2=permit2,
+    )
+
 
 def create_mock_swap_response(response_data: dict) -> MagicMock:
     """Create a mock CreateSwapQuoteResponse object from response data.
 
     This bypasses the buggy Pydantic validation in the generated code.
     """
-    mock = MagicMock()
-    mock.to_amount = response_data.get("toAmount")
-    mock.min_to_amount = response_data.get("minToAmount")
-
-    # Mock transaction
     tx_data = response_data.get("transaction", {})
-    mock.transaction = MagicMock()
-    mock.transaction.to = tx_data.get("to")
-    mock.transaction.data = tx_data.get("data")
-    mock.transaction.value = tx_data.get("value")
-    mock.transaction.gas = tx_data.get("gas")
-    mock.transaction.gas_price = tx_data.get("gasPrice")
-    mock.transaction.max_fee_per_gas = tx_data.get("maxFeePerGas")
-    mock.transaction.max_priority_fee_per_gas = tx_data.get("maxPriorityFeePerGas")
-
-    # Mock permit2
     permit2_data = response_data.get("permit2")
-    if permit2_data and permit2_data.get("eip712"):
-        mock.permit2 = MagicMock()
-        mock.permit2.eip712 = permit2_data.get("eip712")
-        mock.permit2.hash = permit2_data.get("hash")
-    else:
-        mock.permit2 = None
-
-    return mock
-
-
-@pytest.fixture(autouse=True)
+    has_permit2 = bool(permit2_data and permit2_data.get("eip712"))
+    return _build_mock_swap_response(
+        response_data.get("toAmount"),
+        response_data.get("minToAmount"),
+        tx_data.get("to"),
+        tx_data.get("data"),
+        tx_data.get("value"),
+        tx_data.get("gas"),
+        tx_data.get("gasPrice"),
+        tx_data.get("maxFeePerGas"),
+        tx_data.get("maxPriorityFeePerGas"),
+        json.dumps(permit2_data["eip712"], sort_keys=True) if has_permit2 else None,
+        permit2_data.get("hash") if has_permit2 else None,
+    )
+
+
+@pytest.fixture(autouse=True, scope="module")
 def patch_from_dict():
-    """Patch CreateSwapQuoteResponse.from_dict to bypass buggy Pydantic validation."""
+    """Patch CreateSwapQuoteResponse.from_dict to bypass buggy Pydantic validation.
+
+    Module-scoped: the patch target and side effect are test-independent, so
+    one enter/exit covers the whole module.
+    """
     with patch(
         "cdp.openapi_client.models.create_swap_quote_response.CreateSwapQuoteResponse.from_dict",
-        side_effect=lambda obj: create_mock_swap_response(obj),
+        side_effect=create_mock_swap_response,
     ):
         yield
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_api_clients():
-    """Create mock API clients."""
-    api_clients = MagicMock(spec=ApiClients)
-    api_clients.evm_swaps = AsyncMock()
-    return api_clients
+    """Create mock API clients, shared across the module.
 
+    A plain SimpleNamespace is much cheaper to build than a spec'd MagicMock,
+    and these tests only ever touch ``evm_swaps``.
+    """
+    return SimpleNamespace(evm_swaps=AsyncMock())
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def evm_client(mock_api_clients):
-    """Create EVM client with mocked API clients."""
+    """Create EVM client with mocked API clients, shared across the module."""
     return EvmClient(mock_api_clients)
 
 
+@pytest.fixture(autouse=True)
+def _reset_evm_swaps(mock_api_clients):
+    """Reset the shared evm_swaps mock between tests."""
+    mock_api_clients.evm_swaps.reset_mock(return_value=True, side_effect=True)
+
+
 class TestGetSwapPrice:
     """Test get_swap_price functionality."""
 
-    @pytest.mark.asyncio
-    async def test_get_swap_price_success(self, evm_client, mock_api_clients):
-        """Test successful price retrieval."""
+    @pytest.mark.parametrize(
+        ("payload_fixture", "from_token", "to_token", "from_amount", "network", "expected_to"),
+        [
+            pytest.param(
+                "eth_usdc_price_bytes",
+                "0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE",  # ETH
+                "0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913",  # USDC
+                "1000000000000000000",
+                "base",
+                "2000000000",
+                id="eth_to_usdc",
+            ),
+            pytest.param(
+                "usdc_eth_price_bytes",
+                "0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913",  # USDC
+                "0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE",  # ETH
+                "1000000000",
+                "ethereum",
+                "500000000000000000",
+                id="usdc_to_eth",
+            ),
+        ],
+    )
+    async def test_get_swap_price_success(
+        self,
+        request,
+        evm_client,
+        mock_api_clients,
+        payload_fixture,
+        from_token,
+        to_token,
+        from_amount,
+        network,
+        expected_to,
+    ):
+        """Test successful price retrieval across token pairs and networks."""
         # Mock response
-        mock_response = AsyncMock()
-        mock_response.read = AsyncMock(
-            return_value=json.dumps(
-                {
-                    "liquidityAvailable": True,
-                    "toAmount": "2000000000",  # Changed from buyAmount
-                    "fromAmount": "1000000000000000000",  # Changed from sellAmount
-                    "toToken": "0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913",  # Changed from buyToken
-                    "fromToken": "0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE",  # Changed from sellToken
-                    "minToAmount": "1980000000",  # Changed from minBuyAmount
-                    "blockNumber": "123456",
-                    "gasPrice": "50000000000",
-                    "gas": "200000",
-                    "fees": {
-                        "gasFee": {
-                            "amount": "1000000000000000",
-                            "token": "0x0000000000000000000000000000000000000000",
-                        },
-                        "protocolFee": {
-                            "amount": "0",
-                            "token": "0x0000000000000000000000000000000000000000",
-                        },
-                    },
-                    "issues": {
-                        "allowance": {
-                            "currentAllowance": "0",
-                            "spender": "0x0000000000000000000000000000000000000000",
-                        },
-                        "balance": {
-                            "token": "0x0000000000000000000000000000000000000000",
-                            "currentBalance": "0",
-                            "requiredBalance": "0",
-                        },
-                        "simulationIncomplete": False,
-                    },
-                }
-            ).encode()
-        )
-        mock_api_clients.evm_swaps.get_evm_swap_price_without_preload_content.return_value = (
-            mock_response
-        )
+        price_api = mock_api_clients.evm_swaps.get_evm_swap_price_without_preload_content
+        price_api.return_value = _BytesResp(request.getfixturevalue(payload_fixture))
 
         # Call get_swap_price
         price = await evm_client.get_swap_price(
-            from_token="0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE",  # ETH
-            to_token="0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913",  # USDC
-            from_amount="1000000000000000000",
-            network="base",
+            from_token=from_token,
+            to_token=to_token,
+            from_amount=from_amount,
+            network=network,
             taker="0x1234567890123456789012345678901234567890",  # Test account address
         )
 
         # Verify price
         assert price.quote_id
-        assert price.from_token == "0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE"
-        assert price.to_token == "0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913"
-        assert price.from_amount == "1000000000000000000"
-        assert price.to_amount == "2000000000"  # From toAmount in response
+        assert price.from_token == from_token
+        assert price.to_token == to_token
+        assert price.from_amount == from_amount
+        assert price.to_amount == expected_to  # From toAmount in response
         assert float(price.price_ratio) > 0
 
-    @pytest.mark.asyncio
-    async def test_get_swap_price_with_contract_addresses(self, evm_client, mock_api_clients):
-        """Test price with contract addresses."""
-        # Mock response
-        mock_response = AsyncMock()
-        mock_response.read = AsyncMock(
-            return_value=json.dumps(
-                {
-                    "liquidityAvailable": True,
-                    "toAmount": "500000000000000000",  # 0.5 ETH
-                    "fromAmount": "1000000000",  # 1000 USDC
-                    "toToken": "0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE",
-                    "fromToken": "0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913",
-                    "minToAmount": "495000000000000000",
-                    "blockNumber": "123457",
-                    "gasPrice": "50000000000",
-                    "gas": "200000",
-                    "fees": {
-                        "gasFee": {
-                            "amount": "1000000000000000",
-                            "token": "0x0000000000000000000000000000000000000000",
-                        },
-                        "protocolFee": {
-                            "amount": "0",
-                            "token": "0x0000000000000000000000000000000000000000",
-                        },
-                    },
-                    "issues": {
-                        "allowance": {
-                            "currentAllowance": "0",
-                            "spender": "0x0000000000000000000000000000000000000000",
-                        },
-                        "balance": {
-                            "token": "0x0000000000000000000000000000000000000000",
-                            "currentBalance": "0",
-                            "requiredBalance": "0",
-                        },
-                        "simulationIncomplete": False,
-                    },
-                }
-            ).encode()
-        )
-        mock_api_clients.evm_swaps.get_evm_swap_price_without_preload_content.return_value = (
-            mock_response
-        )
-
-        # Call with contract addresses
-        price = await evm_client.get_swap_price(
-            from_token="0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913",  # USDC
-            to_token="0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE",  # ETH
-            from_amount="1000000000",
-            network="ethereum",
-            taker="0x1234567890123456789012345678901234567890",  # Test account address
-        )
-
-        # Verify
-        assert price.from_amount == "1000000000"
-        assert price.to_amount == "500000000000000000"
-
-    @pytest.mark.asyncio
     async def test_get_swap_price_insufficient_liquidity(self, evm_client, mock_api_clients):
         """Test price with insufficient liquidity."""
         # Mock response
-        mock_response = AsyncMock()
-        mock_response.read = AsyncMock(
-            return_value=json.dumps({"liquidityAvailable": False}).encode()
-        )
-        mock_api_clients.evm_swaps.get_evm_swap_price_without_preload_content.return_value = (
-            mock_response
-        )
+        price_api = mock_api_clients.evm_swaps.get_evm_swap_price_without_preload_content
+        price_api.return_value = _BytesResp(_INSUFFICIENT_LIQUIDITY_BYTES)
 
         # Should raise error
         with pytest.raises(ValueError, match="Insufficient liquidity"):
@@ -217,238 +361,105 @@ class TestGetSwapPrice:
 class TestCreateSwapQuote:
     """Test create_swap_quote functionality."""
 
-    @pytest.mark.asyncio
-    async def test_create_swap_quote_eth_to_token(self, evm_client, mock_api_clients):
-        """Test creating ETH to token swap."""
+    @pytest.mark.parametrize(
+        (
+            "payload_fixture",
+            "from_token",
+            "to_token",
+            "from_amount",
+            "network",
+            "slippage_bps",
+            "expected_value",
+            "expects_permit2",
+        ),
+        [
+            pytest.param(
+                "eth_usdc_quote_bytes",
+                "0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE",  # ETH
+                "0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913",  # USDC
+                "1000000000000000000",
+                "base",
+                100,  # 1%
+                "1000000000000000000",
+                False,
+                id="eth_to_token",
+            ),
+            pytest.param(
+                "usdc_weth_permit2_quote_bytes",
+                "0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913",  # USDC
+                "0x4200000000000000000000000000000000000006",  # WETH
+                "1000000000",
+                "base",
+                None,
+                "0",
+                True,
+                id="token_to_token_with_permit2",
+            ),
+            pytest.param(
+                "custom_slippage_quote_bytes",
+                "0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE",  # ETH
+                "0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913",  # USDC
+                "1000000000000000000",
+                "ethereum",
+                250,  # 2.5%
+                "0",
+                False,
+                id="custom_slippage",
+            ),
+        ],
+    )
+    async def test_create_swap_quote_success(
+        self,
+        request,
+        evm_client,
+        mock_api_clients,
+        payload_fixture,
+        from_token,
+        to_token,
+        from_amount,
+        network,
+        slippage_bps,
+        expected_value,
+        expects_permit2,
+    ):
+        """Test creating swaps across token pairs, Permit2, and slippage settings."""
         # Mock response
-        mock_response = AsyncMock()
-        mock_response.read = AsyncMock(
-            return_value=json.dumps(
-                {
-                    "liquidityAvailable": True,
-                    "toAmount": "2000000000",  # 2000 USDC
-                    "fromAmount": "1000000000000000000",  # 1 ETH
-                    "toToken": "0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913",
-                    "fromToken": "0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE",
-                    "minToAmount": "1980000000",
-                    "blockNumber": "123456",
-                    "fees": {
-                        "gasFee": {
-                            "amount": "1000000000000000",
-                            "token": "0x0000000000000000000000000000000000000000",
-                        },
-                        "protocolFee": {
-                            "amount": "0",
-                            "token": "0x0000000000000000000000000000000000000000",
-                        },
-                    },
-                    "issues": {
-                        "allowance": {
-                            "currentAllowance": "0",
-                            "spender": "0x0000000000000000000000000000000000000000",
-                        },
-                        "balance": {
-                            "token": "0x0000000000000000000000000000000000000000",
-                            "currentBalance": "0",
-                            "requiredBalance": "0",
-                        },
-                        "simulationIncomplete": False,
-                    },
-                    "transaction": {
-                        "to": "0x1234567890123456789012345678901234567890",
-                        "data": "0xabcdef",
-                        "value": "1000000000000000000",
-                        "gas": "200000",
-                        "gasPrice": "50000000000",
-                    },
-                    "permit2": None,  # No permit2 needed for native ETH swaps
-                }
-            ).encode()
-        )
-        mock_api_clients.evm_swaps.create_evm_swap_quote_without_preload_content.return_value = (
-            mock_response
-        )
+        quote_api = mock_api_clients.evm_swaps.create_evm_swap_quote_without_preload_content
+        quote_api.return_value = _BytesResp(request.getfixturevalue(payload_fixture))
 
         # Create swap
+        kwargs = {} if slippage_bps is None else {"slippage_bps": slippage_bps}
         swap_quote = await evm_client.create_swap_quote(
-            from_token="0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE",  # ETH
-            to_token="0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913",  # USDC
-            from_amount="1000000000000000000",
-            network="base",
+            from_token=from_token,
+            to_token=to_token,
+            from_amount=from_amount,
+            network=network,
             taker="0x9876543210987654321098765432109876543210",
-            slippage_bps=100,  # 1%
+            **kwargs,
         )
 
         # Verify
         assert isinstance(swap_quote, QuoteSwapResult)
         assert swap_quote.to == "0x1234567890123456789012345678901234567890"
         assert swap_quote.data == "0xabcdef"
-        assert swap_quote.value == "1000000000000000000"
-        assert swap_quote.to_amount == "2000000000"
-        assert swap_quote.from_amount == "1000000000000000000"
-        assert swap_quote.min_to_amount == "1980000000"
-        assert not swap_quote.requires_signature
-        assert swap_quote.permit2_data is None
-
-    @pytest.mark.asyncio
-    async def test_create_swap_quote_token_to_token_with_permit2(
-        self, evm_client, mock_api_clients
-    ):
-        """Test creating token to token swap with Permit2."""
-        # Mock response
-        mock_response = AsyncMock()
-        mock_response.read = AsyncMock(
-            return_value=json.dumps(
-                {
-                    "liquidityAvailable": True,
-                    "toAmount": "500000000000000000",  # 0.5 WETH
-                    "fromAmount": "1000000000",  # 1000 USDC
-                    "toToken": "0x4200000000000000000000000000000000000006",
-                    "fromToken": "0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913",
-                    "minToAmount": "495000000000000000",
-                    "blockNumber": "123457",
-                    "fees": {
-                        "gasFee": {
-                            "amount": "1000000000000000",
-                            "token": "0x0000000000000000000000000000000000000000",
-                        },
-                        "protocolFee": {
-                            "amount": "0",
-                            "token": "0x0000000000000000000000000000000000000000",
-                        },
-                    },
-                    "issues": {
-                        "allowance": {
-                            "currentAllowance": "0",
-                            "spender": "0x0000000000000000000000000000000000000000",
-                        },
-                        "balance": {
-                            "token": "0x0000000000000000000000000000000000000000",
-                            "currentBalance": "0",
-                            "requiredBalance": "0",
-                        },
-                        "simulationIncomplete": False,
-                    },
-                    "transaction": {
-                        "to": "0x1234567890123456789012345678901234567890",
-                        "data": "0xabcdef",
-                        "value": "0",
-                        "gas": "200000",
-                        "gasPrice": "50000000000",
-                    },
-                    "permit2": {
-                        "eip712": {
-                            "domain": {
-                                "name": "Permit2",
-                                "chainId": 8453,
-                                "verifyingContract": "0xB952578f3520EE8Ea45b7914994dcf4702cEe578",
-                            },
-                            "types": {"PermitTransferFrom": []},
-                            "primaryType": "PermitTransferFrom",
-                            "message": {},
-                        },
-                        "hash": "0x" + "a" * 64,  # 32 bytes = 64 hex chars
-                    },
-                }
-            ).encode()
-        )
-        mock_api_clients.evm_swaps.create_evm_swap_quote_without_preload_content.return_value = (
-            mock_response
-        )
-
-        # Create swap
-        swap_quote = await evm_client.create_swap_quote(
-            from_token="0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913",  # USDC
-            to_token="0x4200000000000000000000000000000000000006",  # WETH
-            from_amount="1000000000",
-            network="base",
-            taker="0x9876543210987654321098765432109876543210",
-        )
+        assert swap_quote.value == expected_value
+        assert swap_quote.from_amount == from_amount
+        assert swap_quote.requires_signature is expects_permit2
+        if expects_permit2:
+            assert swap_quote.permit2_data is not None
+            assert swap_quote.permit2_data.hash == _PERMIT2_MOCK_HASH
+        else:
+            assert swap_quote.permit2_data is None
+
+        # Verify the requested slippage was passed through in basis points
+        if slippage_bps is not None:
+            assert quote_api.call_args[0][0].slippage_bps == slippage_bps
 
-        # Verify
-        assert swap_quote.requires_signature
-        assert swap_quote.permit2_data is not None
-        assert swap_quote.permit2_data.hash == "0x" + "a" * 64
-        assert swap_quote.value == "0"
-
-    @pytest.mark.asyncio
-    async def test_create_swap_quote_custom_slippage(self, evm_client, mock_api_clients):
-        """Test creating swap with custom slippage."""
-        # Mock response
-        mock_response = AsyncMock()
-        mock_response.read = AsyncMock(
-            return_value=json.dumps(
-                {
-                    "liquidityAvailable": True,
-                    "toAmount": "2000000000",  # 2000 USDC
-                    "fromAmount": "1000000000000000000",  # 1 ETH
-                    "toToken": "0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913",
-                    "fromToken": "0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE",
-                    "minToAmount": "1950000000",  # 2.5% slippage
-                    "blockNumber": "123458",
-                    "fees": {
-                        "gasFee": {
-                            "amount": "1000000000000000",
-                            "token": "0x0000000000000000000000000000000000000000",
-                        },
-                        "protocolFee": {
-                            "amount": "0",
-                            "token": "0x0000000000000000000000000000000000000000",
-                        },
-                    },
-                    "issues": {
-                        "allowance": {
-                            "currentAllowance": "0",
-                            "spender": "0x0000000000000000000000000000000000000000",
-                        },
-                        "balance": {
-                            "token": "0x0000000000000000000000000000000000000000",
-                            "currentBalance": "0",
-                            "requiredBalance": "0",
-                        },
-                        "simulationIncomplete": False,
-                    },
-                    "transaction": {
-                        "to": "0x1234567890123456789012345678901234567890",
-                        "data": "0xabcdef",
-                        "value": "0",
-                        "gas": "200000",
-                        "gasPrice": "50000000000",
-                    },
-                    "permit2": None,  # No permit2 for this test
-                }
-            ).encode()
-        )
-        mock_api_clients.evm_swaps.create_evm_swap_quote_without_preload_content.return_value = (
-            mock_response
-        )
-
-        # Create swap with 2.5% slippage
-        await evm_client.create_swap_quote(
-            from_token="0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE",  # ETH
-            to_token="0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913",  # USDC
-            from_amount="1000000000000000000",
-            network="ethereum",
-            taker="0x9876543210987654321098765432109876543210",
-            slippage_bps=250,  # 2.5%
-        )
-
-        # Verify slippage was converted to basis points (250)
-        call_args = (
-            mock_api_clients.evm_swaps.create_evm_swap_quote_without_preload_content.call_args
-        )
-        request = call_args[0][0]
-        assert request.slippage_bps == 250
-
-    @pytest.mark.asyncio
     async def test_create_swap_quote_invalid_json_response(self, evm_client, mock_api_clients):
         """Test create_swap_quote with invalid JSON response."""
         # Mock response with invalid JSON
-        mock_response = AsyncMock()
-        mock_response.read = AsyncMock(return_value=b"invalid json")
-        mock_api_clients.evm_swaps.create_evm_swap_quote_without_preload_content.return_value = (
-            mock_response
-        )
+        quote_api = mock_api_clients.evm_swaps.create_evm_swap_quote_without_preload_content
+        quote_api.return_value = _BytesResp(b"invalid json")
 
         # Should raise error
         with pytest.raises(ValueError, match="Invalid JSON response"):
@@ -460,15 +471,11 @@ class TestCreateSwapQuote:
                 taker="0x9876543210987654321098765432109876543210",
             )
 
-    @pytest.mark.asyncio
     async def test_create_swap_quote_empty_response(self, evm_client, mock_api_clients):
         """Test create_swap_quote with empty response."""
         # Mock empty response
-        mock_response = AsyncMock()
-        mock_response.read = AsyncMock(return_value=b"")
-        mock_api_clients.evm_swaps.create_evm_swap_quote_without_preload_content.return_value = (
-            mock_response
-        )
+        quote_api = mock_api_clients.evm_swaps.create_evm_swap_quote_without_preload_content
+        quote_api.return_value = _BytesResp(b"")
 
         # Should raise error
         with pytest.raises(ValueError, match="Empty response"):
@@ -480,17 +487,11 @@ class TestCreateSwapQuote:
                 taker="0x9876543210987654321098765432109876543210",
             )
 
-    @pytest.mark.asyncio
     async def test_create_swap_quote_insufficient_liquidity(self, evm_client, mock_api_clients):
         """Test create_swap_quote with insufficient liquidity."""
         # Mock response
-        mock_response = AsyncMock()
-        mock_response.read = AsyncMock(
-            return_value=json.dumps({"liquidityAvailable": False}).encode()
-        )
-        mock_api_clients.evm_swaps.create_evm_swap_quote_without_preload_content.return_value = (
-            mock_response
-        )
+        quote_api = mock_api_clients.evm_swaps.create_evm_swap_quote_without_preload_content
+        quote_api.return_value = _BytesResp(_INSUFFICIENT_LIQUIDITY_BYTES)
 
         # Create swap
         swap_quote = await evm_client.create_swap_quote(
@@ -1,19 +1,95 @@
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from cdp.api_clients import ApiClients
 from cdp.evm_call_types import FunctionCall
-from cdp.evm_smart_account import EvmSmartAccount
+from cdp.evm_message_types import EIP712Domain
+from cdp.evm_smart_account import EvmSmartAccount, use_api_clients
 from cdp.evm_token_balances import (
     EvmToken,
     EvmTokenAmount,
     EvmTokenBalance,
     ListTokenBalancesResult,
 )
-from cdp.openapi_client.models.evm_user_operation import EvmUserOperation
 from cdp.openapi_client.models.request_evm_faucet_request import RequestEvmFaucetRequest
 
+# Typed data with nested arrays, a nested struct and bytes32 salts, used to
+# cover pass-through of non-trivial payloads; tests only read it.
+_COMPLEX_DOMAIN = EIP712Domain(
+    name="Complex Protocol",
+    version="3.1.4",
+    chain_id=137,  # Polygon
+    verifying_contract="0x2222222222222222222222222222222222222222",
+    salt="0x" + "ff" * 32,
+)
+
+_COMPLEX_TYPES = {
+    "EIP712Domain": [
+        {"name": "name", "type": "string"},
+        {"name": "version", "type": "string"},
+        {"name": "chainId", "type": "uint256"},
+        {"name": "verifyingContract", "type": "address"},
+        {"name": "salt", "type": "bytes32"},
+    ],
+    "Order": [
+        {"name": "maker", "type": "address"},
+        {"name": "taker", "type": "address"},
+        {"name": "assets", "type": "Asset[]"},
+        {"name": "metadata", "type": "OrderMetadata"},
+    ],
+    "Asset": [
+        {"name": "token", "type": "address"},
+        {"name": "amount", "type": "uint256"},
+        {"name": "tokenId", "type": "uint256"},
+    ],
+    "OrderMetadata": [
+        {"name": "deadline", "type": "uint256"},
+        {"name": "salt", "type": "bytes32"},
+        {"name": "flags", "type": "uint8"},
+    ],
+}
+
+_COMPLEX_MESSAGE = {
+    "maker": "0x3333333333333333333333333333333333333333",
+    "taker": "0x4444444444444444444444444444444444444444",
+    "assets": [
+        {
+            "token": "0x5555555555555555555555555555555555555555",
+            "amount": "1000000000000000000",
+            "tokenId": "1",
+        },
+        {
+            "token": "0x6666666666666666666666666666666666666666",
+            "amount": "2000000000000000000",
+            "tokenId": "2",
+        },
+    ],
+    "metadata": {
+        "deadline": "1234567890",
+        "salt": "0x" + "aa" * 32,
+        "flags": "255",
+    },
+}
+
+# Tests never mutate this call, so one immutable instance serves them all.
+_TRANSFER_FUNCTION_CALL = FunctionCall(
+    to="0x2345678901234567890123456789012345678901",
+    abi=[{"name": "transfer", "inputs": [{"type": "address"}, {"type": "uint256"}]}],
+    function_name="transfer",
+    args=["0x3456789012345678901234567890123456789012", 100],
+    value=None,
+)
+
+
+def _acoro(value):
+    """Return an async stub resolving to value; cheaper than an AsyncMock wrapper."""
+
+    async def _inner(*_args, **_kwargs):
+        return value
+
+    return _inner
+
 
 class TestEvmSmartAccount:
     """Test suite for the EvmSmartAccount class."""
@@ -70,16 +146,14 @@ class TestEvmSmartAccount:
         assert account_no_name.name is None
 
 
-@pytest.mark.asyncio
-async def test_list_token_balances(smart_account_factory, evm_token_balances_model_factory):
+async def test_list_token_balances(
+    smart_account_with_api, evm_token_balances_model_factory, api_clients_stub
+):
     """Test list_token_balances method."""
     address = "0x1234567890123456789012345678901234567890"
     name = "test-account"
-    smart_account = smart_account_factory(address, name)
 
-    mock_onchain_data_api = AsyncMock()
-    mock_api_clients = AsyncMock()
-    mock_api_clients.onchain_data = mock_onchain_data_api
+    mock_onchain_data_api = api_clients_stub.onchain_data
 
     mock_token_balances = evm_token_balances_model_factory()
 
@@ -100,7 +174,7 @@ async def test_list_token_balances(smart_account_factory, evm_token_balances_mod
         next_page_token="next-page-token",
     )
 
-    smart_account = EvmSmartAccount(address, smart_account.owners[0], name, None, mock_api_clients)
+    smart_account = smart_account_with_api(address, name)
 
     result = await smart_account.list_token_balances(network="base-sepolia")
 
@@ -111,18 +185,17 @@ async def test_list_token_balances(smart_account_factory, evm_token_balances_mod
     assert result == expected_result
 
 
-@pytest.mark.asyncio
 @patch("cdp.actions.evm.send_user_operation.Web3")
 @patch("cdp.actions.evm.send_user_operation.ensure_awaitable")
-@patch("cdp.cdp_client.ApiClients")
 async def test_send_user_operation(
-    mock_api_clients,
     mock_ensure_awaitable,
     mock_web3,
-    smart_account_model_factory,
-    local_account_factory,
+    shared_smart_account_model,
+    shared_local_account,
+    api_clients_stub,
 ):
     """Test send_user_operation method."""
+    mock_api_clients = api_clients_stub
     mock_contract = MagicMock()
     mock_contract.encode_abi.return_value = "0x1234abcd"
 
@@ -130,35 +203,24 @@ async def test_send_user_operation(
     mock_web3_instance.eth.contract.return_value = mock_contract
     mock_web3.return_value = mock_web3_instance
 
-    mock_user_op = MagicMock(spec=EvmUserOperation)
-    mock_user_op.user_op_hash = "0xuserhash123"
+    mock_user_op = SimpleNamespace(user_op_hash="0xuserhash123", status="broadcast")
 
     mock_signed_payload = MagicMock()
     mock_signed_payload.signature = bytes.fromhex("aabbcc")
     mock_ensure_awaitable.return_value = mock_signed_payload
 
-    mock_api_clients.evm_smart_accounts.prepare_user_operation = AsyncMock(
-        return_value=mock_user_op
-    )
-    mock_api_clients.evm_smart_accounts.send_user_operation = AsyncMock(return_value=mock_user_op)
+    mock_api_clients.evm_smart_accounts.prepare_user_operation = _acoro(mock_user_op)
+    mock_api_clients.evm_smart_accounts.send_user_operation = _acoro(mock_user_op)
 
-    smart_account_model = smart_account_model_factory()
-    owner = local_account_factory()
+    smart_account_model = shared_smart_account_model
+    owner = shared_local_account
 
     smart_account = EvmSmartAccount(
         smart_account_model.address, owner, smart_account_model.name, None, mock_api_clients
     )
 
-    function_call = FunctionCall(
-        to="0x2345678901234567890123456789012345678901",
-        abi=[{"name": "transfer", "inputs": [{"type": "address"}, {"type": "uint256"}]}],
-        function_name="transfer",
-        args=["0x3456789012345678901234567890123456789012", 100],
-        value=None,
-    )
-
     result = await smart_account.send_user_operation(
-        calls=[function_call],
+        calls=[_TRANSFER_FUNCTION_CALL],
         network="base-sepolia",
         paymaster_url="https://paymaster.example.com",
     )
@@ -166,22 +228,69 @@ async def test_send_user_operation(
     assert result == mock_user_op
 
 
-@pytest.mark.asyncio
-@patch("cdp.cdp_client.ApiClients")
+async def test_bulk_send_user_operations(shared_smart_account_model, shared_local_account):
+    """Test that bulk_send_user_operations sends all operations and keeps order."""
+    smart_account_model = shared_smart_account_model
+    owner = shared_local_account
+
+    smart_account = EvmSmartAccount(smart_account_model.address, owner, smart_account_model.name)
+
+    mock_user_ops = [SimpleNamespace(user_op_hash=f"0xuserhash{i}") for i in range(3)]
+
+    with patch.object(
+        EvmSmartAccount, "send_user_operation", AsyncMock(side_effect=mock_user_ops)
+    ) as mock_send:
+        results = await smart_account.bulk_send_user_operations(
+            [
+                {"calls": [], "network": "base-sepolia"},
+                {"calls": [], "network": "base-sepolia"},
+                {"calls": [], "network": "base"},
+            ]
+        )
+
+    assert results == mock_user_ops
+    assert mock_send.call_count == 3
+
+
+async def test_bulk_send_user_operations_returns_exceptions_in_place(
+    shared_smart_account_model, shared_local_account
+):
+    """Test that a failed send yields its exception at the matching position."""
+    smart_account_model = shared_smart_account_model
+    owner = shared_local_account
+
+    smart_account = EvmSmartAccount(smart_account_model.address, owner, smart_account_model.name)
+
+    ok_op = SimpleNamespace(user_op_hash="0xuserhash0")
+    error = ValueError("boom")
+
+    with patch.object(
+        EvmSmartAccount, "send_user_operation", AsyncMock(side_effect=[ok_op, error])
+    ):
+        results = await smart_account.bulk_send_user_operations(
+            [
+                {"calls": [], "network": "base-sepolia"},
+                {"calls": [], "network": "base-sepolia"},
+            ]
+        )
+
+    assert results[0] == ok_op
+    assert results[1] is error
+
+
 async def test_wait_for_user_operation(
-    mock_api_clients,
-    smart_account_model_factory,
-    local_account_factory,
+    shared_smart_account_model,
+    shared_local_account,
+    api_clients_stub,
 ):
     """Test wait_for_user_operation method."""
-    mock_user_op = MagicMock(spec=EvmUserOperation)
-    mock_user_op.user_op_hash = "0xuserhash123"
-    mock_user_op.status = "complete"
+    mock_api_clients = api_clients_stub
+    mock_user_op = SimpleNamespace(user_op_hash="0xuserhash123", status="complete")
 
-    mock_api_clients.evm_smart_accounts.get_user_operation = AsyncMock(return_value=mock_user_op)
+    mock_api_clients.evm_smart_accounts.get_user_operation = _acoro(mock_user_op)
 
-    smart_account_model = smart_account_model_factory()
-    owner = local_account_factory()
+    smart_account_model = shared_smart_account_model
+    owner = shared_local_account
 
     smart_account = EvmSmartAccount(
         smart_account_model.address, owner, smart_account_model.name, None, mock_api_clients
@@ -194,22 +303,19 @@ async def test_wait_for_user_operation(
     assert result == mock_user_op
 
 
-@pytest.mark.asyncio
-@patch("cdp.cdp_client.ApiClients")
 async def test_get_user_operation(
-    mock_api_clients,
-    smart_account_model_factory,
-    local_account_factory,
+    shared_smart_account_model,
+    shared_local_account,
+    api_clients_stub,
 ):
     """Test get_user_operation method."""
-    mock_user_op = MagicMock(spec=EvmUserOperation)
-    mock_user_op.user_op_hash = "0xuserhash123"
-    mock_user_op.status = "complete"
+    mock_api_clients = api_clients_stub
+    mock_user_op = SimpleNamespace(user_op_hash="0xuserhash123", status="complete")
 
-    mock_api_clients.evm_smart_accounts.get_user_operation = AsyncMock(return_value=mock_user_op)
+    mock_api_clients.evm_smart_accounts.get_user_operation = _acoro(mock_user_op)
 
-    smart_account_model = smart_account_model_factory()
-    owner = local_account_factory()
+    smart_account_model = shared_smart_account_model
+    owner = shared_local_account
 
     smart_account = EvmSmartAccount(
         smart_account_model.address, owner, smart_account_model.name, None, mock_api_clients
@@ -222,16 +328,113 @@ async def test_get_user_operation(
     assert result == mock_user_op
 
 
-@pytest.mark.asyncio
-async def test_request_faucet(smart_account_model_factory):
+async def test_ambient_api_clients_used_when_none_provided(
+    shared_smart_account_model,
+    shared_local_account,
+    api_clients_stub,
+):
+    """Test that accounts built without api_clients use the ambient ones."""
+    mock_api_clients = api_clients_stub
+    mock_user_op = SimpleNamespace(user_op_hash="0xuserhash123", status="pending")
+
+    mock_api_clients.evm_smart_accounts.get_user_operation = _acoro(mock_user_op)
+
+    smart_account_model = shared_smart_account_model
+    owner = shared_local_account
+
+    smart_account = EvmSmartAccount(smart_account_model.address, owner, smart_account_model.name)
+
+    assert smart_account.api_clients is None
+
+    with use_api_clients(mock_api_clients):
+        result = await smart_account.get_user_operation(
+            user_op_hash=mock_user_op.user_op_hash,
+        )
+
+    assert result == mock_user_op
+    assert smart_account.api_clients is None
+
+
+async def test_get_user_operation_coalesces_concurrent_calls(
+    shared_smart_account_model,
+    shared_local_account,
+    api_clients_stub,
+):
+    """Test that concurrent identical get_user_operation calls share one API call."""
+    mock_api_clients = api_clients_stub
+    import asyncio
+
+    mock_user_op = SimpleNamespace(user_op_hash="0xuserhash123", status="pending")
+
+    release = asyncio.Event()
+
+    async def slow_get(*_args, **_kwargs):
+        await release.wait()
+        return mock_user_op
+
+    mock_api_clients.evm_smart_accounts.get_user_operation = AsyncMock(side_effect=slow_get)
+
+    smart_account_model = shared_smart_account_model
+    owner = shared_local_account
+
+    smart_account = EvmSmartAccount(
+        smart_account_model.address, owner, smart_account_model.name, None, mock_api_clients
+    )
+
+    tasks = [
+        asyncio.create_task(smart_account.get_user_operation(mock_user_op.user_op_hash))
+        for _ in range(5)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks)
+
+    assert all(result == mock_user_op for result in results)
+    mock_api_clients.evm_smart_accounts.get_user_operation.assert_called_once()
+
+    # A later call after the first completes hits the API again
+    await smart_account.get_user_operation(mock_user_op.user_op_hash)
+    assert mock_api_clients.evm_smart_accounts.get_user_operation.call_count == 2
+
+
+async def test_get_user_operation_caches_terminal_status(
+    shared_smart_account_model,
+    shared_local_account,
+    api_clients_stub,
+):
+    """Test that a terminal user operation is served from cache on repeat reads."""
+    mock_api_clients = api_clients_stub
+    pending_op = SimpleNamespace(user_op_hash="0xuserhash123", status="pending")
+    complete_op = SimpleNamespace(user_op_hash="0xuserhash123", status="complete")
+
+    mock_api_clients.evm_smart_accounts.get_user_operation = AsyncMock(
+        side_effect=[pending_op, complete_op]
+    )
+
+    smart_account_model = shared_smart_account_model
+    owner = shared_local_account
+
+    smart_account = EvmSmartAccount(
+        smart_account_model.address, owner, smart_account_model.name, None, mock_api_clients
+    )
+
+    # Pending results are not cached, so each read hits the API
+    assert (await smart_account.get_user_operation("0xuserhash123")).status == "pending"
+    assert (await smart_account.get_user_operation("0xuserhash123")).status == "complete"
+
+    # The terminal result is cached; no further API calls are made
+    assert (await smart_account.get_user_operation("0xuserhash123")).status == "complete"
+    assert mock_api_clients.evm_smart_accounts.get_user_operation.call_count == 2
+
+
+async def test_request_faucet(smart_account_model_factory, api_clients_stub):
     """Test request_faucet method."""
     address = "0x1234567890123456789012345678901234567890"
     name = "test-account"
     smart_account_model = smart_account_model_factory(address, name)
 
-    mock_faucets_api = AsyncMock()
-    mock_api_instance = AsyncMock()
-    mock_api_instance.faucets = mock_faucets_api
+    mock_api_instance = api_clients_stub
+    mock_faucets_api = mock_api_instance.faucets
 
     mock_response = AsyncMock()
     mock_response.transaction_hash = "0x123"
@@ -255,26 +458,75 @@ async def test_request_faucet(smart_account_model_factory):
     )
     assert result == "0x123"
 
-    @pytest.mark.asyncio
-    async def test_sign_typed_data_success(self, smart_account_factory):
-        """Test successful signing of typed data."""
-        from cdp.evm_message_types import EIP712Domain
 
-        address = "0x1234567890123456789012345678901234567890"
-        name = "test-account"
-        smart_account = smart_account_factory(address, name)
+async def test_sign_typed_data_invalid_network(smart_account_with_api):
+    """Test signing typed data with invalid network raises error."""
+    smart_account = smart_account_with_api(name=None)
 
-        # Mock API clients
-        mock_api_clients = AsyncMock(spec=ApiClients)
-        smart_account = EvmSmartAccount(
-            address, smart_account.owners[0], name, None, mock_api_clients
+    domain = EIP712Domain(name="Test")
+    types = {}
+    primary_type = "Test"
+    message = {}
+
+    # Test with unsupported network
+    with pytest.raises(ValueError) as exc_info:
+        await smart_account.sign_typed_data(
+            domain=domain,
+            types=types,
+            primary_type=primary_type,
+            message=message,
+            network="unsupported-network",
         )
 
+    assert "Unsupported network: unsupported-network" in str(exc_info.value)
+
+
+@pytest.fixture
+def mock_sign_and_wrap():
+    """Patch sign_and_wrap_typed_data_for_smart_account for the signing tests."""
+    with patch("cdp.evm_smart_account.sign_and_wrap_typed_data_for_smart_account") as mock_sign:
+        mock_sign.return_value = "0x" + "b" * 130  # 65 bytes signature in hex
+        yield mock_sign
+
+
+@pytest.mark.parametrize(
+    ("network", "expected_chain_id", "expected_exc", "complex_data"),
+    [
+        pytest.param("ethereum", 1, None, False, id="ethereum"),
+        pytest.param("base", 8453, None, False, id="base"),
+        pytest.param("ethereum-sepolia", 11155111, None, False, id="ethereum-sepolia"),
+        pytest.param("polygon", 137, None, False, id="polygon"),
+        pytest.param("ethereum", 1, Exception("Signing failed"), False, id="error_propagation"),
+        pytest.param("polygon", 137, None, True, id="complex_typed_data"),
+    ],
+)
+async def test_sign_typed_data_network_chain_id(
+    smart_account_with_api,
+    api_clients_stub,
+    mock_sign_and_wrap,
+    network,
+    expected_chain_id,
+    expected_exc,
+    complex_data,
+):
+    """Test that sign_typed_data maps each supported network to its chain id."""
+    address = "0x1234567890123456789012345678901234567890"
+    name = "test-account"
+
+    mock_api_clients = api_clients_stub
+    smart_account = smart_account_with_api(address, name)
+
+    if complex_data:
+        domain = _COMPLEX_DOMAIN
+        types = _COMPLEX_TYPES
+        primary_type = "Order"
+        message = _COMPLEX_MESSAGE
+    else:
         # Create test domain
         domain = EIP712Domain(
             name="Test Contract",
             version="1",
-            chain_id=1,
+            chain_id=expected_chain_id,
             verifying_contract="0x000000000022D473030F116dDEE9F6B43aC78BA3",
         )
 
@@ -302,281 +554,47 @@ async def test_request_faucet(smart_account_model_factory):
             "data": "0x00",
         }
 
-        # Mock the sign_and_wrap_typed_data_for_smart_account function
-        expected_signature = "0x" + "b" * 130  # 65 bytes signature in hex
-
-        with patch("cdp.evm_smart_account.sign_and_wrap_typed_data_for_smart_account") as mock_sign:
-            mock_sign.return_value = expected_signature
-
-            # Call the method
-            result = await smart_account.sign_typed_data(
-                domain=domain,
-                types=types,
-                primary_type=primary_type,
-                message=message,
-                network="ethereum",
-            )
-
-            # Verify the result
-            assert result == expected_signature
-
-            # Verify the function was called with correct parameters
-            mock_sign.assert_called_once()
-            call_args = mock_sign.call_args
-
-            assert call_args[0][0] == mock_api_clients  # api_clients
-
-            options = call_args[0][1]  # SignAndWrapTypedDataForSmartAccountOptions
-            assert options.smart_account == smart_account
-            assert options.chain_id == 1  # Ethereum mainnet
-            assert options.typed_data["domain"] == domain
-            assert options.typed_data["types"] == types
-            assert options.typed_data["primaryType"] == primary_type
-            assert options.typed_data["message"] == message
-            assert options.owner_index == 0
-
-    @pytest.mark.asyncio
-    async def test_sign_typed_data_with_base_network(self, smart_account_factory):
-        """Test signing typed data on Base network."""
-        from cdp.evm_message_types import EIP712Domain
-
-        address = "0x1234567890123456789012345678901234567890"
-        smart_account = smart_account_factory(address)
-
-        mock_api_clients = AsyncMock(spec=ApiClients)
-        smart_account = EvmSmartAccount(
-            address, smart_account.owners[0], None, None, mock_api_clients
-        )
-
-        domain = EIP712Domain(
-            name="Base Test",
-            chain_id=8453,
-            verifying_contract="0x1111111111111111111111111111111111111111",
-        )
-
-        types = {"Message": [{"name": "content", "type": "string"}]}
-        primary_type = "Message"
-        message = {"content": "Hello Base"}
-
-        expected_signature = "0x" + "c" * 130
-
-        with patch("cdp.evm_smart_account.sign_and_wrap_typed_data_for_smart_account") as mock_sign:
-            mock_sign.return_value = expected_signature
-
-            result = await smart_account.sign_typed_data(
-                domain=domain,
-                types=types,
-                primary_type=primary_type,
-                message=message,
-                network="base",
-            )
-
-            assert result == expected_signature
-
-            # Verify chain_id was set correctly for Base
-            options = mock_sign.call_args[0][1]
-            assert options.chain_id == 8453  # Base mainnet
-
-    @pytest.mark.asyncio
-    async def test_sign_typed_data_with_testnet(self, smart_account_factory):
-        """Test signing typed data on testnet."""
-        from cdp.evm_message_types import EIP712Domain
-
-        address = "0x1234567890123456789012345678901234567890"
-        smart_account = smart_account_factory(address)
-
-        mock_api_clients = AsyncMock(spec=ApiClients)
-        smart_account = EvmSmartAccount(
-            address, smart_account.owners[0], None, None, mock_api_clients
-        )
-
-        domain = EIP712Domain(name="Sepolia Test", version="2", chain_id=11155111)
-
-        types = {"Test": [{"name": "value", "type": "uint256"}]}
-        primary_type = "Test"
-        message = {"value": "42"}
-
-        expected_signature = "0x" + "d" * 130
-
-        with patch("cdp.evm_smart_account.sign_and_wrap_typed_data_for_smart_account") as mock_sign:
-            mock_sign.return_value = expected_signature
-
-            result = await smart_account.sign_typed_data(
-                domain=domain,
-                types=types,
-                primary_type=primary_type,
-                message=message,
-                network="ethereum-sepolia",
-            )
-
-            assert result == expected_signature
-
-            # Verify chain_id was set correctly for Ethereum Sepolia
-            options = mock_sign.call_args[0][1]
-            assert options.chain_id == 11155111
-
-    @pytest.mark.asyncio
-    async def test_sign_typed_data_invalid_network(self, smart_account_factory):
-        """Test signing typed data with invalid network raises error."""
-        from cdp.evm_message_types import EIP712Domain
-
-        address = "0x1234567890123456789012345678901234567890"
-        smart_account = smart_account_factory(address)
-
-        mock_api_clients = AsyncMock(spec=ApiClients)
-        smart_account = EvmSmartAccount(
-            address, smart_account.owners[0], None, None, mock_api_clients
-        )
-
-        domain = EIP712Domain(name="Test")
-        types = {}
-        primary_type = "Test"
-        message = {}
-
-        # Test with unsupported network
-        with pytest.raises(ValueError) as exc_info:
+    # Errors raised by the signing helper must propagate to the caller
+    if expected_exc is not None:
+        mock_sign_and_wrap.side_effect = expected_exc
+        with pytest.raises(type(expected_exc), match=str(expected_exc)):
             await smart_account.sign_typed_data(
                 domain=domain,
                 types=types,
                 primary_type=primary_type,
                 message=message,
-                network="unsupported-network",
+                network=network,
             )
+        return
+
+    # Call the method
+    result = await smart_account.sign_typed_data(
+        domain=domain,
+        types=types,
+        primary_type=primary_type,
+        message=message,
+        network=network,
+    )
 
-        assert "Unsupported network: unsupported-network" in str(exc_info.value)
-
-    @pytest.mark.asyncio
-    async def test_sign_typed_data_complex_types(self, smart_account_factory):
-        """Test signing typed data with complex nested types."""
-        from cdp.evm_message_types import EIP712Domain
-
-        address = "0x1234567890123456789012345678901234567890"
-        smart_account = smart_account_factory(address)
-
-        mock_api_clients = AsyncMock(spec=ApiClients)
-        smart_account = EvmSmartAccount(
-            address, smart_account.owners[0], None, None, mock_api_clients
-        )
-
-        # Complex domain with all fields
-        domain = EIP712Domain(
-            name="Complex Protocol",
-            version="3.1.4",
-            chain_id=137,  # Polygon
-            verifying_contract="0x2222222222222222222222222222222222222222",
-            salt="0x" + "ff" * 32,
-        )
-
-        # Complex nested types
-        types = {
-            "EIP712Domain": [
-                {"name": "name", "type": "string"},
-                {"name": "version", "type": "string"},
-                {"name": "chainId", "type": "uint256"},
-                {"name": "verifyingContract", "type": "address"},
-                {"name": "salt", "type": "bytes32"},
-            ],
-            "Order": [
-                {"name": "maker", "type": "address"},
-                {"name": "taker", "type": "address"},
-                {"name": "assets", "type": "Asset[]"},
-                {"name": "metadata", "type": "OrderMetadata"},
-            ],
-            "Asset": [
-                {"name": "token", "type": "address"},
-                {"name": "amount", "type": "uint256"},
-                {"name": "tokenId", "type": "uint256"},
-            ],
-            "OrderMetadata": [
-                {"name": "deadline", "type": "uint256"},
-                {"name": "salt", "type": "bytes32"},
-                {"name": "flags", "type": "uint8"},
-            ],
-        }
-
-        primary_type = "Order"
-
-        # Complex nested message
-        message = {
-            "maker": "0x3333333333333333333333333333333333333333",
-            "taker": "0x4444444444444444444444444444444444444444",
-            "assets": [
-                {
-                    "token": "0x5555555555555555555555555555555555555555",
-                    "amount": "1000000000000000000",
-                    "tokenId": "1",
-                },
-                {
-                    "token": "0x6666666666666666666666666666666666666666",
-                    "amount": "2000000000000000000",
-                    "tokenId": "2",
-                },
-            ],
-            "metadata": {
-                "deadline": "1234567890",
-                "salt": "0x" + "aa" * 32,
-                "flags": "255",
-            },
-        }
-
-        expected_signature = "0x" + "e" * 130
-
-        with patch("cdp.evm_smart_account.sign_and_wrap_typed_data_for_smart_account") as mock_sign:
-            mock_sign.return_value = expected_signature
-
-            result = await smart_account.sign_typed_data(
-                domain=domain,
-                types=types,
-                primary_type=primary_type,
-                message=message,
-                network="polygon",
-            )
-
-            assert result == expected_signature
-
-            # Verify all data was passed correctly
-            options = mock_sign.call_args[0][1]
-            assert options.chain_id == 137  # Polygon mainnet
-            assert options.typed_data["domain"] == domain
-            assert options.typed_data["types"] == types
-            assert options.typed_data["primaryType"] == primary_type
-            assert options.typed_data["message"] == message
-
-    @pytest.mark.asyncio
-    async def test_sign_typed_data_error_propagation(self, smart_account_factory):
-        """Test that errors from sign_and_wrap_typed_data_for_smart_account are propagated."""
-        from cdp.evm_message_types import EIP712Domain
-
-        address = "0x1234567890123456789012345678901234567890"
-        smart_account = smart_account_factory(address)
-
-        mock_api_clients = AsyncMock(spec=ApiClients)
-        smart_account = EvmSmartAccount(
-            address, smart_account.owners[0], None, None, mock_api_clients
-        )
-
-        domain = EIP712Domain(name="Error Test")
-        types = {}
-        primary_type = "Test"
-        message = {}
+    # Verify the result
+    assert result == mock_sign_and_wrap.return_value
 
-        # Mock the function to raise an error
-        with patch("cdp.evm_smart_account.sign_and_wrap_typed_data_for_smart_account") as mock_sign:
-            mock_sign.side_effect = Exception("Signing failed")
+    # Verify the function was called with correct parameters
+    mock_sign_and_wrap.assert_called_once()
+    call_args = mock_sign_and_wrap.call_args
 
-            with pytest.raises(Exception) as exc_info:
-                await smart_account.sign_typed_data(
-                    domain=domain,
-                    types=types,
-                    primary_type=primary_type,
-                    message=message,
-                    network="ethereum",
-                )
+    assert call_args.kwargs["api_clients"] == mock_api_clients
 
-            assert "Signing failed" in str(exc_info.value)
+    options = call_args.kwargs["options"]  # SignAndWrapTypedDataForSmartAccountOptions
+    assert options.smart_account == smart_account
+    assert options.chain_id == expected_chain_id
+    assert options.typed_data["domain"] == domain
+    assert options.typed_data["types"] == types
+    assert options.typed_data["primaryType"] == primary_type
+    assert options.typed_data["message"] == message
+    assert options.owner_index == 0
 
 
-@pytest.mark.asyncio
 async def test_network_scoped_smart_account_uses_base_node_rpc_as_paymaster(smart_account_factory):
     """Test that NetworkScopedEvmSmartAccount uses Base Node RPC URL as paymaster_url for UserOp sends on base networks."""
     smart_account = smart_account_factory()
@@ -604,7 +622,7 @@ async def test_network_scoped_smart_account_uses_base_node_rpc_as_paymaster(smar
             # Verify that Base Node RPC URL was used as paymaster_url
             mock_get_base_node_rpc_url.assert_called_once()
             mock_send_user_op.assert_called_once_with(
-                smart_account._EvmSmartAccount__api_clients,
+                smart_account.api_clients,
                 smart_account.address,
                 smart_account.owners[0],
                 calls,
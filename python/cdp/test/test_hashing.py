@@ -0,0 +1,18 @@
+"""Tests for the keccak256 helper."""
+
+from eth_utils import keccak
+
+from cdp._hashing import keccak256
+
+
+def test_keccak256_matches_eth_utils():
+    """Test that keccak256 agrees with eth_utils regardless of backend."""
+    for data in (b"", b"hello", b"\x19\x01" + b"\x00" * 64):
+        assert keccak256(data) == keccak(data)
+
+
+def test_keccak256_known_vector():
+    """Test keccak256 against the well-known empty-input digest."""
+    assert (
+        keccak256(b"").hex() == "c5d2460186f7233c927e7db2dcc703c0e500b653ca82273b7bfad8045d85a470"
+    )
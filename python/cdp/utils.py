@@ -1,11 +1,50 @@
+import asyncio
 import hashlib
 import inspect
 import re
 import uuid
+from collections.abc import Awaitable, Callable
+from typing import Any
 
 from eth_account.typed_transactions import DynamicFeeTransaction
 
 
+class AsyncSingleFlight:
+    """Coalesce concurrent calls with the same key into a single in-flight request.
+
+    When several coroutines request the same resource at the same time, only the
+    first actually runs the underlying coroutine; the rest await the same result.
+    Sequential calls are unaffected — once a call completes, the next one runs
+    the underlying coroutine again.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: dict[Any, asyncio.Task] = {}
+
+    async def run(self, key: Any, coro_factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Run the coroutine for `key`, sharing the result with concurrent callers.
+
+        Args:
+            key: A hashable key identifying the request.
+            coro_factory: A zero-argument callable returning the coroutine to run.
+
+        Returns:
+            The result of the coroutine.
+
+        """
+        existing = self._inflight.get(key)
+        if existing is not None:
+            # Shield so one waiter being cancelled doesn't cancel the shared call
+            return await asyncio.shield(existing)
+
+        task = asyncio.ensure_future(coro_factory())
+        self._inflight[key] = task
+        try:
+            return await task
+        finally:
+            self._inflight.pop(key, None)
+
+
 async def ensure_awaitable(func, *args, **kwargs):
     """Ensure a function call returns an awaitable result.
 
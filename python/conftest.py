@@ -1,6 +1,7 @@
 import os
 from pathlib import Path
-from unittest.mock import patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -23,6 +24,74 @@ def mock_send_event():
         yield mock
 
 
+# Keep the cached analytics disable flags in sync with the environment,
+# since tests toggle the env vars around individual cases.
+@pytest.fixture(autouse=True)
+def refresh_analytics_flags():
+    """Re-read the cached analytics disable flags before each test."""
+    from cdp.analytics import _refresh_flags
+
+    _refresh_flags()
+    yield
+
+
+# Tests only ever touch a handful of API children, so an explicit attribute
+# bag is much cheaper than spec'ing the whole ApiClients class. Built once
+# per session and reset between tests.
+@pytest.fixture(scope="session")
+def _api_clients_stub():
+    """Build the ApiClients stub once per session."""
+    stub = SimpleNamespace(
+        evm_smart_accounts=AsyncMock(),
+        onchain_data=AsyncMock(),
+        faucets=AsyncMock(),
+    )
+    # Snapshot each child's attribute names so explicitly assigned stubs
+    # (plain coroutine functions, AsyncMocks) can be removed between tests;
+    # reset_mock() only resets mock state, not assigned attributes.
+    baseline = {name: set(child.__dict__) for name, child in vars(stub).items()}
+    return stub, baseline
+
+
+@pytest.fixture
+def api_clients_stub(_api_clients_stub):
+    """Return the shared ApiClients stub, reset between tests."""
+    stub, baseline = _api_clients_stub
+    for name, child in vars(stub).items():
+        for attr in set(child.__dict__) - baseline[name]:
+            # Bypass Mock.__delattr__, which would leave a tombstone that
+            # makes later auto-created attribute access raise AttributeError
+            object.__delattr__(child, attr)
+        child.reset_mock(return_value=True, side_effect=True)
+    return stub
+
+
+# Deriving a local account address is the slowest fixture work in the suite
+# (ECDSA scalar multiplication), so build one immutable account and model per
+# session. These mirror the defaults of the function-scoped factories, which
+# session scope cannot depend on directly.
+@pytest.fixture(scope="session")
+def shared_local_account():
+    """Create one local account shared across the whole session."""
+    from eth_account import Account
+
+    return Account.from_key("0x" + "1" * 64)
+
+
+@pytest.fixture(scope="session")
+def shared_smart_account_model():
+    """Create one smart account model shared across the whole session."""
+    from cdp.openapi_client.models.evm_smart_account import (
+        EvmSmartAccount as EvmSmartAccountModel,
+    )
+
+    return EvmSmartAccountModel(
+        address="0x1234567890123456789012345678901234567890",
+        owners=["0x1234567890123456789012345678901234567890"],
+        name="test-smart-account",
+    )
+
+
 # Get the path to the base directory
 BASE_DIR = Path(__file__).parent
 